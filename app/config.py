@@ -1,15 +1,26 @@
 """
 Centralized Configuration Management for AURIX.
-Uses Pydantic for validation and type safety.
+Settings are plain dataclasses populated from environment variables.
 """
 
 import os
-import streamlit as st
-from typing import Optional, Dict, Any
-from pydantic import Field, AliasChoices
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from functools import lru_cache
+import uuid
+from datetime import datetime
+from dataclasses import dataclass, field, replace
+from typing import Optional, Dict, Any, Mapping
 from enum import Enum
+from types import MappingProxyType
+
+try:
+    from dotenv import dotenv_values
+except ImportError:  # python-dotenv is optional at runtime
+    dotenv_values = None
+
+# .env is parsed once at import and layered under the process environment
+_DOTENV: Dict[str, str] = (
+    {k: v for k, v in dotenv_values(".env").items() if v is not None}
+    if dotenv_values else {}
+)
 
 
 class Environment(str, Enum):
@@ -31,197 +42,365 @@ class LLMProvider(str, Enum):
     MOCK = "mock"
 
 
-class DatabaseSettings(BaseSettings):
-    """Database configuration."""
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+# ============================================
+# Environment Parsing Helpers
+# ============================================
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+
+
+def _read_env() -> Dict[str, str]:
+    """
+    Snapshot .env and os.environ with upper-cased keys.
+    Lets each setting use a single uppercase name while still accepting
+    lowercase variables; an exact uppercase variable takes precedence,
+    and the process environment overrides .env.
+    """
+    env: Dict[str, str] = {}
+    for source in (_DOTENV, os.environ):
+        seen = set()
+        for key, value in source.items():
+            upper = key.upper()
+            if key == upper or upper not in seen:
+                env[upper] = value
+                seen.add(upper)
+    return env
+
+
+def _env_int(env: Mapping[str, str], key: str, default: int) -> int:
+    """Read an integer value from the environment."""
+    value = env.get(key)
+    return int(value) if value else default
+
+
+def _env_float(env: Mapping[str, str], key: str, default: float) -> float:
+    """Read a float value from the environment."""
+    value = env.get(key)
+    return float(value) if value else default
+
 
-    host: str = Field(default="", validation_alias=AliasChoices("NEON_HOST", "neon_host"))
-    database: str = Field(default="", validation_alias=AliasChoices("NEON_DATABASE", "neon_database"))
-    user: str = Field(default="", validation_alias=AliasChoices("NEON_USER", "neon_user"))
-    password: str = Field(default="", validation_alias=AliasChoices("NEON_PASSWORD", "neon_password"))
-    port: int = Field(default=5432, validation_alias=AliasChoices("NEON_PORT", "neon_port"))
-    pool_size: int = Field(default=10, validation_alias=AliasChoices("DATABASE_POOL_SIZE", "database_pool_size"))
+def _env_bool(env: Mapping[str, str], key: str, default: bool) -> bool:
+    """Read a boolean flag from the environment."""
+    value = env.get(key)
+    if not value:
+        return default
+    return value.strip().lower() in _TRUE_VALUES
+
+
+class _EnvSettings:
+    """Shared base for settings classes built from the environment."""
+    __slots__ = ()
+
+    @classmethod
+    def from_env(cls, env: Optional[Mapping[str, str]] = None):
+        """Build settings from the environment (read once when not given)."""
+        return cls._from_env(_read_env() if env is None else env)
+
+    @classmethod
+    def _from_env(cls, env: Mapping[str, str]):
+        """Build settings from an upper-cased environment mapping."""
+        return cls()
+
+
+@dataclass(slots=True, frozen=True)
+class DatabaseSettings(_EnvSettings):
+    """Database configuration."""
+    host: str = ""
+    database: str = ""
+    user: str = ""
+    password: str = ""
+    port: int = 5432
+    pool_size: int = 10
+
+    # Derived once in __post_init__; values never change after construction
+    _connection_string: str = field(init=False, repr=False, compare=False)
+    _is_configured: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        configured = bool(self.host and self.database and self.user and self.password)
+        object.__setattr__(self, "_is_configured", configured)
+        object.__setattr__(
+            self,
+            "_connection_string",
+            f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+            if configured else "",
+        )
+
+    @classmethod
+    def _from_env(cls, env: Mapping[str, str]) -> "DatabaseSettings":
+        """Build database settings from environment variables."""
+        return cls(
+            host=env.get("NEON_HOST", ""),
+            database=env.get("NEON_DATABASE", ""),
+            user=env.get("NEON_USER", ""),
+            password=env.get("NEON_PASSWORD", ""),
+            port=_env_int(env, "NEON_PORT", 5432),
+            pool_size=_env_int(env, "DATABASE_POOL_SIZE", 10),
+        )
 
     @property
     def connection_string(self) -> str:
-        """Generate database connection string."""
-        if not all([self.host, self.database, self.user, self.password]):
-            return ""
-        return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+        """Database connection string (empty when not configured)."""
+        return self._connection_string
 
     @property
     def is_configured(self) -> bool:
         """Check if database is configured."""
-        return bool(self.host and self.database and self.user and self.password)
+        return self._is_configured
 
 
-class LLMSettings(BaseSettings):
-    """LLM provider configuration."""
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+# LLM provider -> LLMSettings attribute holding its API key
+_PROVIDER_KEY_ATTR = MappingProxyType({
+    LLMProvider.GROQ: "groq_api_key",
+    LLMProvider.TOGETHER: "together_api_key",
+    LLMProvider.GOOGLE: "google_api_key",
+    LLMProvider.OPENROUTER: "openrouter_api_key",
+    LLMProvider.ANTHROPIC: "anthropic_api_key",
+    LLMProvider.OPENAI: "openai_api_key",
+})
+
 
-    default_provider: LLMProvider = Field(default=LLMProvider.MOCK, validation_alias=AliasChoices("LLM_PROVIDER", "llm_provider"))
-    temperature: float = Field(default=0.3, validation_alias=AliasChoices("LLM_TEMPERATURE", "llm_temperature"))
-    max_tokens: int = Field(default=4096, validation_alias=AliasChoices("LLM_MAX_TOKENS", "llm_max_tokens"))
+@dataclass(slots=True, frozen=True)
+class LLMSettings(_EnvSettings):
+    """LLM provider configuration."""
+    default_provider: LLMProvider = LLMProvider.MOCK
+    temperature: float = 0.3
+    max_tokens: int = 4096
 
     # API Keys for various providers
-    groq_api_key: str = Field(default="", validation_alias=AliasChoices("GROQ_API_KEY", "groq_api_key"))
-    together_api_key: str = Field(default="", validation_alias=AliasChoices("TOGETHER_API_KEY", "together_api_key"))
-    google_api_key: str = Field(default="", validation_alias=AliasChoices("GOOGLE_API_KEY", "google_api_key"))
-    openrouter_api_key: str = Field(default="", validation_alias=AliasChoices("OPENROUTER_API_KEY", "openrouter_api_key"))
-    anthropic_api_key: str = Field(default="", validation_alias=AliasChoices("ANTHROPIC_API_KEY", "anthropic_api_key"))
-    openai_api_key: str = Field(default="", validation_alias=AliasChoices("OPENAI_API_KEY", "openai_api_key"))
+    groq_api_key: str = ""
+    together_api_key: str = ""
+    google_api_key: str = ""
+    openrouter_api_key: str = ""
+    anthropic_api_key: str = ""
+    openai_api_key: str = ""
 
     # Ollama specific
-    ollama_base_url: str = Field(default="http://localhost:11434", validation_alias=AliasChoices("OLLAMA_BASE_URL", "ollama_base_url"))
+    ollama_base_url: str = "http://localhost:11434"
+
+    @classmethod
+    def _from_env(cls, env: Mapping[str, str]) -> "LLMSettings":
+        """Build LLM settings from environment variables."""
+        return cls(
+            default_provider=LLMProvider(env.get("LLM_PROVIDER") or LLMProvider.MOCK.value),
+            temperature=_env_float(env, "LLM_TEMPERATURE", 0.3),
+            max_tokens=_env_int(env, "LLM_MAX_TOKENS", 4096),
+            groq_api_key=env.get("GROQ_API_KEY", ""),
+            together_api_key=env.get("TOGETHER_API_KEY", ""),
+            google_api_key=env.get("GOOGLE_API_KEY", ""),
+            openrouter_api_key=env.get("OPENROUTER_API_KEY", ""),
+            anthropic_api_key=env.get("ANTHROPIC_API_KEY", ""),
+            openai_api_key=env.get("OPENAI_API_KEY", ""),
+            ollama_base_url=env.get("OLLAMA_BASE_URL", "http://localhost:11434"),
+        )
 
     def get_api_key(self, provider: LLMProvider) -> str:
         """Get API key for specific provider."""
-        key_map = {
-            LLMProvider.GROQ: self.groq_api_key,
-            LLMProvider.TOGETHER: self.together_api_key,
-            LLMProvider.GOOGLE: self.google_api_key,
-            LLMProvider.OPENROUTER: self.openrouter_api_key,
-            LLMProvider.ANTHROPIC: self.anthropic_api_key,
-            LLMProvider.OPENAI: self.openai_api_key,
-        }
-        return key_map.get(provider, "")
-
-
-class RAGSettings(BaseSettings):
-    """RAG engine configuration."""
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
-
-    chunk_size: int = Field(default=1000, validation_alias=AliasChoices("RAG_CHUNK_SIZE", "rag_chunk_size"))
-    chunk_overlap: int = Field(default=200, validation_alias=AliasChoices("RAG_CHUNK_OVERLAP", "rag_chunk_overlap"))
-    embedding_model: str = Field(default="all-MiniLM-L6-v2", validation_alias=AliasChoices("RAG_EMBEDDING_MODEL", "rag_embedding_model"))
-    top_k_results: int = Field(default=5, validation_alias=AliasChoices("RAG_TOP_K", "rag_top_k"))
-    similarity_threshold: float = Field(default=0.7, validation_alias=AliasChoices("RAG_SIMILARITY_THRESHOLD", "rag_similarity_threshold"))
-    use_hybrid_search: bool = Field(default=True, validation_alias=AliasChoices("RAG_HYBRID_SEARCH", "rag_hybrid_search"))
+        attr = _PROVIDER_KEY_ATTR.get(provider)
+        return getattr(self, attr) if attr else ""
 
 
-class AuditSettings(BaseSettings):
+@dataclass(slots=True, frozen=True)
+class RAGSettings(_EnvSettings):
+    """RAG engine configuration."""
+    chunk_size: int = 1000
+    chunk_overlap: int = 200
+    embedding_model: str = "all-MiniLM-L6-v2"
+    top_k_results: int = 5
+    similarity_threshold: float = 0.7
+    use_hybrid_search: bool = True
+
+    @classmethod
+    def _from_env(cls, env: Mapping[str, str]) -> "RAGSettings":
+        """Build RAG settings from environment variables."""
+        return cls(
+            chunk_size=_env_int(env, "RAG_CHUNK_SIZE", 1000),
+            chunk_overlap=_env_int(env, "RAG_CHUNK_OVERLAP", 200),
+            embedding_model=env.get("RAG_EMBEDDING_MODEL", "all-MiniLM-L6-v2"),
+            top_k_results=_env_int(env, "RAG_TOP_K", 5),
+            similarity_threshold=_env_float(env, "RAG_SIMILARITY_THRESHOLD", 0.7),
+            use_hybrid_search=_env_bool(env, "RAG_HYBRID_SEARCH", True),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class AuditSettings(_EnvSettings):
     """Audit-specific configuration."""
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
-
     # Risk scoring weights
-    inherent_risk_weight: float = Field(default=0.6)
-    control_effectiveness_weight: float = Field(default=0.4)
+    inherent_risk_weight: float = 0.6
+    control_effectiveness_weight: float = 0.4
 
     # Risk thresholds
-    high_risk_threshold: float = Field(default=0.7)
-    medium_risk_threshold: float = Field(default=0.4)
+    high_risk_threshold: float = 0.7
+    medium_risk_threshold: float = 0.4
 
     # Sampling
-    default_sample_size: int = Field(default=25)
-    min_sample_size: int = Field(default=10)
-    max_sample_size: int = Field(default=100)
-
+    default_sample_size: int = 25
+    min_sample_size: int = 10
+    max_sample_size: int = 100
 
-class AppSettings(BaseSettings):
-    """Main application settings."""
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
+@dataclass(slots=True)
+class AppSettings(_EnvSettings):
+    """
+    Main application settings.
+    Sub-configurations are frozen; secrets overlays swap in replacements.
+    """
     # Application
-    app_name: str = Field(default="AURIX")
-    app_version: str = Field(default="4.0.0")
-    app_tagline: str = Field(default="Intelligent Audit. Elevated Assurance.")
-    environment: Environment = Field(default=Environment.DEVELOPMENT, validation_alias=AliasChoices("APP_ENV", "app_env"))
-    debug: bool = Field(default=False, validation_alias=AliasChoices("DEBUG", "debug"))
+    app_name: str = "AURIX"
+    app_version: str = "4.0.0"
+    app_tagline: str = "Intelligent Audit. Elevated Assurance."
+    environment: Environment = Environment.DEVELOPMENT
+    debug: bool = False
 
     # Logging
-    log_level: str = Field(default="INFO", validation_alias=AliasChoices("LOG_LEVEL", "log_level"))
-    log_format: str = Field(default="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    log_level: str = "INFO"
+    log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
     # Security
-    secret_key: str = Field(default="change-me-in-production", validation_alias=AliasChoices("SECRET_KEY", "secret_key"))
+    secret_key: str = "change-me-in-production"
 
     # Feature flags
-    enable_visitor_tracking: bool = Field(default=True, validation_alias=AliasChoices("ENABLE_VISITOR_TRACKING", "enable_visitor_tracking"))
-    enable_mock_data_fallback: bool = Field(default=True, validation_alias=AliasChoices("ENABLE_MOCK_DATA", "enable_mock_data"))
-
-    # Sub-configurations
-    database: DatabaseSettings = Field(default_factory=DatabaseSettings)
-    llm: LLMSettings = Field(default_factory=LLMSettings)
-    rag: RAGSettings = Field(default_factory=RAGSettings)
-    audit: AuditSettings = Field(default_factory=AuditSettings)
+    enable_visitor_tracking: bool = True
+    enable_mock_data_fallback: bool = True
+
+    # Sub-configurations (frozen, so the default instances are shared)
+    database: DatabaseSettings = DatabaseSettings()
+    llm: LLMSettings = LLMSettings()
+    rag: RAGSettings = RAGSettings()
+    audit: AuditSettings = AuditSettings()
+
+    @classmethod
+    def _from_env(cls, env: Mapping[str, str]) -> "AppSettings":
+        """
+        Build application settings from environment variables.
+        The environment is read once and shared with every sub-configuration.
+        """
+        return cls(
+            environment=Environment(env.get("APP_ENV") or Environment.DEVELOPMENT.value),
+            debug=_env_bool(env, "DEBUG", False),
+            log_level=env.get("LOG_LEVEL", "INFO"),
+            secret_key=env.get("SECRET_KEY", "change-me-in-production"),
+            enable_visitor_tracking=_env_bool(env, "ENABLE_VISITOR_TRACKING", True),
+            enable_mock_data_fallback=_env_bool(env, "ENABLE_MOCK_DATA", True),
+            database=DatabaseSettings._from_env(env),
+            llm=LLMSettings._from_env(env),
+            rag=RAGSettings._from_env(env),
+            audit=AuditSettings._from_env(env),
+        )
 
 
-@lru_cache()
-def get_settings() -> AppSettings:
-    """
-    Get cached application settings.
-    Uses lru_cache to ensure settings are only loaded once.
-    """
-    return AppSettings()
+# Global settings instance
+settings: AppSettings = AppSettings.from_env()
 
 
-# Global settings instance
-settings = get_settings()
+def get_settings() -> AppSettings:
+    """Get the application settings singleton (loaded once at import)."""
+    return settings
+
+
+_uuid4 = uuid.uuid4
+_now = datetime.now
+
+# Session state defaults; mutable containers are stored as factories so a
+# fresh object is only built for keys missing from the session.
+_SESSION_DEFAULTS = (
+    ('theme', 'dark'),
+    ('documents', list),
+    ('chat_history', list),
+    ('risk_assessments', dict),
+    ('kri_data', dict),
+    ('findings', list),
+    ('continuous_audit_rules', list),
+    ('working_papers', list),
+    ('visitor_id', None),
+    ('session_start', None),
+    ('page_views', 0),
+    ('visited_pages', list),
+    ('current_page', 'Dashboard'),
+)
 
 
 def init_app():
     """
     Initialize application state and configurations.
-    Called once at application startup.
+    Seeds session defaults once per session; later reruns return early.
     """
+    import streamlit as st
+
+    ss = st.session_state
+    if ss.get('_aurix_inited'):
+        return  # Streamlit reruns main() on every interaction
+
     # Initialize session state defaults
-    defaults = {
-        'theme': 'dark',
-        'documents': [],
-        'chat_history': [],
-        'risk_assessments': {},
-        'kri_data': {},
-        'findings': [],
-        'continuous_audit_rules': [],
-        'working_papers': [],
-        'visitor_id': None,
-        'session_start': None,
-        'page_views': 0,
-        'visited_pages': [],
-        'current_page': 'Dashboard',
-    }
-    
-    for key, default_value in defaults.items():
-        if key not in st.session_state:
-            st.session_state[key] = default_value
-    
+    for key, default in _SESSION_DEFAULTS:
+        if key not in ss:
+            ss[key] = default() if callable(default) else default
+
     # Initialize visitor tracking
-    if st.session_state.visitor_id is None:
-        import uuid
-        from datetime import datetime
-        st.session_state.visitor_id = str(uuid.uuid4())
-        st.session_state.session_start = datetime.now()
-    
+    if ss.visitor_id is None:
+        ss.visitor_id = str(_uuid4())
+        ss.session_start = _now()
+
     # Try to load secrets from Streamlit (for deployment)
     _load_streamlit_secrets()
 
+    ss['_aurix_inited'] = True
+
 
 def _load_streamlit_secrets():
     """Load secrets from Streamlit secrets management."""
+    import streamlit as st
+
+    secrets = getattr(st, "secrets", None)
     try:
-        if "neon" in st.secrets:
-            settings.database.host = st.secrets["neon"].get("host", "")
-            settings.database.database = st.secrets["neon"].get("database", "")
-            settings.database.user = st.secrets["neon"].get("user", "")
-            settings.database.password = st.secrets["neon"].get("password", "")
-            settings.database.port = int(st.secrets["neon"].get("port", 5432))
-        
-        if "llm" in st.secrets:
-            settings.llm.groq_api_key = st.secrets["llm"].get("groq_api_key", "")
-            settings.llm.google_api_key = st.secrets["llm"].get("google_api_key", "")
+        # load_if_toml_exists() returns False instead of raising when no
+        # secrets.toml exists, so local development skips the error path
+        if secrets is None or not secrets.load_if_toml_exists():
+            return
+        neon = secrets.get("neon") or {}
+        llm = secrets.get("llm") or {}
     except Exception:
-        pass  # Secrets not available (local development)
+        return  # Malformed secrets file
+
+    if neon:
+        settings.database = replace(
+            settings.database,
+            host=neon.get("host", ""),
+            database=neon.get("database", ""),
+            user=neon.get("user", ""),
+            password=neon.get("password", ""),
+            port=int(neon.get("port", 5432)),
+        )
+
+    if llm:
+        settings.llm = replace(
+            settings.llm,
+            groq_api_key=llm.get("groq_api_key", ""),
+            google_api_key=llm.get("google_api_key", ""),
+        )
+
+
+# (DatabaseSettings, config dict) built by the last get_database_config() call
+_db_config_cache: Optional[tuple] = None
 
 
 def get_database_config() -> Dict[str, Any]:
-    """Get database configuration dictionary."""
-    return {
-        'host': settings.database.host,
-        'database': settings.database.database,
-        'user': settings.database.user,
-        'password': settings.database.password,
-        'port': settings.database.port,
-    }
+    """
+    Get database configuration dictionary.
+    The dict is rebuilt only when settings.database has been replaced
+    (e.g. by the Streamlit secrets overlay); treat it as read-only.
+    """
+    global _db_config_cache
+    db = settings.database
+    if _db_config_cache is None or _db_config_cache[0] is not db:
+        _db_config_cache = (db, {
+            'host': db.host,
+            'database': db.database,
+            'user': db.user,
+            'password': db.password,
+            'port': db.port,
+        })
+    return _db_config_cache[1]
 
 
 def is_production() -> bool:
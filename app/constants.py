@@ -3,15 +3,19 @@ Application Constants for AURIX.
 All hardcoded values should be defined here for easy maintenance.
 """
 
-from typing import Dict, List, Any
+import sys
+from dataclasses import dataclass
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, List, Any, Final, Optional
 
 
 # ============================================
 # Application Info
 # ============================================
-APP_NAME = "AURIX"
-APP_VERSION = "4.2.0"
-APP_TAGLINE = "Intelligent Audit. Elevated Assurance."
+APP_NAME = sys.intern("AURIX")
+APP_VERSION = sys.intern("4.2.0")
+APP_TAGLINE = sys.intern("Intelligent Audit. Elevated Assurance.")
 APP_DESCRIPTION = """Platform AI komprehensif untuk Internal Audit di industri keuangan Indonesia. 
 Menggabungkan metodologi McKinsey dan Big 4 dengan kecerdasan buatan modern. 
 Dilengkapi 26+ modul audit profesional termasuk:
@@ -33,7 +37,7 @@ TOTAL_MODULES = 26
 # ============================================
 # Theme Colors - Royal Purple & Gold (Premium)
 # ============================================
-COLORS = {
+COLORS = MappingProxyType({
     "dark": {
         # Backgrounds - Deep Royal Purple
         "bg": "#0d0a1a",
@@ -90,7 +94,7 @@ COLORS = {
         # Sidebar
         "sidebar_bg": "#f5f3fa",
     }
-}
+})
 
 
 # ============================================
@@ -102,17 +106,31 @@ class RiskLevel:
     LOW = "LOW"
 
 
-RISK_THRESHOLDS = {
+RISK_THRESHOLDS = MappingProxyType({
     RiskLevel.HIGH: 0.7,
     RiskLevel.MEDIUM: 0.4,
     RiskLevel.LOW: 0.0
-}
+})
+
+# (threshold, level) pairs sorted from highest threshold down
+RISK_BUCKETS = tuple(
+    sorted(((t, lvl) for lvl, t in RISK_THRESHOLDS.items()), reverse=True)
+)
+
+
+def classify_risk(score: float) -> str:
+    """Map a 0-1 risk score to its RiskLevel using RISK_BUCKETS."""
+    for threshold, level in RISK_BUCKETS:
+        if score >= threshold:
+            return level
+    return RiskLevel.LOW
+
 
-RISK_COLORS = {
+RISK_COLORS = MappingProxyType({
     RiskLevel.HIGH: "danger",
     RiskLevel.MEDIUM: "warning",
     RiskLevel.LOW: "success"
-}
+})
 
 
 # ============================================
@@ -134,13 +152,13 @@ class ControlEffectiveness:
 # ============================================
 # Document Types
 # ============================================
-SUPPORTED_DOCUMENT_TYPES = {
+SUPPORTED_DOCUMENT_TYPES = MappingProxyType({
     "pdf": "📄 PDF Document",
     "docx": "📝 Word Document",
     "xlsx": "📊 Excel Spreadsheet",
     "csv": "📋 CSV File",
     "txt": "📃 Text File"
-}
+})
 
 DOCUMENT_CATEGORIES = [
     "Audit Reports",
@@ -157,50 +175,60 @@ DOCUMENT_CATEGORIES = [
 # ============================================
 # LLM Provider Info
 # ============================================
-LLM_PROVIDER_INFO = {
-    "groq": {
-        "name": "Groq",
-        "description": "🚀 FASTEST FREE API - Llama 3.3, Mixtral",
-        "free": True,
-        "url": "https://console.groq.com/keys",
-        "default_model": "llama-3.3-70b-versatile"
-    },
-    "together": {
-        "name": "Together AI",
-        "description": "🆓 Free credits - Llama, Qwen, DeepSeek",
-        "free": True,
-        "url": "https://api.together.xyz/",
-        "default_model": "meta-llama/Llama-3.3-70B-Instruct-Turbo"
-    },
-    "google": {
-        "name": "Google AI Studio",
-        "description": "🆓 Free Gemini 2.0 Flash",
-        "free": True,
-        "url": "https://aistudio.google.com/app/apikey",
-        "default_model": "gemini-2.0-flash-exp"
-    },
-    "openrouter": {
-        "name": "OpenRouter",
-        "description": "🌐 Multi-model access - Free & Paid",
-        "free": True,
-        "url": "https://openrouter.ai/keys",
-        "default_model": "google/gemma-2-9b-it:free"
-    },
-    "ollama": {
-        "name": "Ollama (Local)",
-        "description": "💻 Run LLMs locally - FREE",
-        "free": True,
-        "url": "https://ollama.ai/",
-        "default_model": "llama3.2"
-    },
-    "mock": {
-        "name": "Mock (Demo)",
-        "description": "🧪 Testing without API key",
-        "free": True,
-        "url": None,
-        "default_model": "mock-model"
-    }
-}
+@dataclass(frozen=True, slots=True)
+class ProviderInfo:
+    """Display metadata for an LLM provider."""
+    name: str
+    description: str
+    free: bool
+    url: Optional[str]
+    default_model: str
+
+
+LLM_PROVIDER_INFO = MappingProxyType({
+    "groq": ProviderInfo(
+        name="Groq",
+        description="🚀 FASTEST FREE API - Llama 3.3, Mixtral",
+        free=True,
+        url="https://console.groq.com/keys",
+        default_model="llama-3.3-70b-versatile",
+    ),
+    "together": ProviderInfo(
+        name="Together AI",
+        description="🆓 Free credits - Llama, Qwen, DeepSeek",
+        free=True,
+        url="https://api.together.xyz/",
+        default_model="meta-llama/Llama-3.3-70B-Instruct-Turbo",
+    ),
+    "google": ProviderInfo(
+        name="Google AI Studio",
+        description="🆓 Free Gemini 2.0 Flash",
+        free=True,
+        url="https://aistudio.google.com/app/apikey",
+        default_model="gemini-2.0-flash-exp",
+    ),
+    "openrouter": ProviderInfo(
+        name="OpenRouter",
+        description="🌐 Multi-model access - Free & Paid",
+        free=True,
+        url="https://openrouter.ai/keys",
+        default_model="google/gemma-2-9b-it:free",
+    ),
+    "ollama": ProviderInfo(
+        name="Ollama (Local)",
+        description="💻 Run LLMs locally - FREE",
+        free=True,
+        url="https://ollama.ai/",
+        default_model="llama3.2",
+    ),
+    "mock": ProviderInfo(
+        name="Mock (Demo)",
+        description="🧪 Testing without API key",
+        free=True,
+        url=None,
+        default_model="mock-model",
+    ),
+})
 
 
 # ============================================
@@ -225,31 +253,49 @@ AUDIT_TEST_TYPES = [
     "Compliance Testing"
 ]
 
-FINDING_SEVERITY = {
+FINDING_SEVERITY = MappingProxyType({
     "CRITICAL": {"weight": 5, "color": "danger", "icon": "🔴"},
     "HIGH": {"weight": 4, "color": "danger", "icon": "🔴"},
     "MEDIUM": {"weight": 3, "color": "warning", "icon": "🟡"},
     "LOW": {"weight": 2, "color": "success", "icon": "🟢"},
     "INFORMATIONAL": {"weight": 1, "color": "info", "icon": "🔵"}
-}
+})
+
+
+class Severity(IntEnum):
+    """Finding severity keyed by its FINDING_SEVERITY weight."""
+    INFORMATIONAL = 1
+    LOW = 2
+    MEDIUM = 3
+    HIGH = 4
+    CRITICAL = 5
+
+
+# Severity -> color lookup indexed by weight (SEVERITY_COLORS[Severity.HIGH])
+SEVERITY_COLORS = ("", "info", "success", "warning", "danger", "danger")
 
 
 # ============================================
 # Working Paper Templates
 # ============================================
-WORKING_PAPER_TEMPLATES = {
+def _sections(*names: str) -> tuple:
+    """Build an immutable section list with names shared across templates."""
+    return tuple(sys.intern(name) for name in names)
+
+
+WORKING_PAPER_TEMPLATES = MappingProxyType({
     "Risk Assessment": {
-        "sections": [
+        "sections": _sections(
             "Executive Summary",
             "Inherent Risk Analysis",
             "Control Assessment",
             "Residual Risk",
             "Recommendations"
-        ],
+        ),
         "format": "structured"
     },
     "Testing Workpaper": {
-        "sections": [
+        "sections": _sections(
             "Objective",
             "Scope",
             "Sample Selection",
@@ -257,50 +303,50 @@ WORKING_PAPER_TEMPLATES = {
             "Results",
             "Exceptions",
             "Conclusion"
-        ],
+        ),
         "format": "detailed"
     },
     "Interview Notes": {
-        "sections": [
+        "sections": _sections(
             "Interviewee Details",
             "Questions Asked",
             "Responses",
             "Key Observations",
             "Follow-up Actions"
-        ],
+        ),
         "format": "narrative"
     },
     "Process Walkthrough": {
-        "sections": [
+        "sections": _sections(
             "Process Overview",
             "Steps Documented",
             "Key Controls",
             "Control Gaps",
             "Recommendations"
-        ],
+        ),
         "format": "flowchart"
     },
     "Exception Report": {
-        "sections": [
+        "sections": _sections(
             "Exception Summary",
             "Root Cause Analysis",
             "Impact Assessment",
             "Management Response",
             "Remediation Plan"
-        ],
+        ),
         "format": "structured"
     },
     "Control Testing": {
-        "sections": [
+        "sections": _sections(
             "Control Description",
             "Test Approach",
             "Sample Details",
             "Test Results",
             "Conclusion"
-        ],
+        ),
         "format": "matrix"
     }
-}
+})
 
 
 # ============================================
@@ -315,18 +361,18 @@ DISPLAY_DATETIME_FORMAT = "%d %B %Y, %H:%M"
 # ============================================
 # Pagination
 # ============================================
-DEFAULT_PAGE_SIZE = 10
-MAX_PAGE_SIZE = 100
+DEFAULT_PAGE_SIZE: Final[int] = 10
+MAX_PAGE_SIZE: Final[int] = 100
 
 
 # ============================================
 # File Size Limits
 # ============================================
-MAX_FILE_SIZE_MB = 50
-MAX_FILES_PER_UPLOAD = 10
+MAX_FILE_SIZE_MB: Final[int] = 50
+MAX_FILES_PER_UPLOAD: Final[int] = 10
 
 
 # ============================================
 # Session Timeout
 # ============================================
-SESSION_TIMEOUT_MINUTES = 60
+SESSION_TIMEOUT_MINUTES: Final[int] = 60
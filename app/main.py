@@ -1,23 +1,23 @@
-"""
-╔═══════════════════════════════════════════════════════════════════════════════╗
-║     █████╗ ██╗   ██╗██████╗ ██╗██╗  ██╗                                      ║
-║    ██╔══██╗██║   ██║██╔══██╗██║╚██╗██╔╝                                      ║
-║    ███████║██║   ██║██████╔╝██║ ╚███╔╝                                       ║
-║    ██╔══██║██║   ██║██╔══██╗██║ ██╔██╗                                       ║
-║    ██║  ██║╚██████╔╝██║  ██║██║██╔╝ ██╗                                      ║
-║    ╚═╝  ╚═╝ ╚═════╝ ╚═╝  ╚═╝╚═╝╚═╝  ╚═╝                                      ║
-║                                                                               ║
-║    Intelligent Audit. Elevated Assurance.                                    ║
-║    Version: 4.0.0 Enterprise                                                 ║
-╚═══════════════════════════════════════════════════════════════════════════════╝
+# ╔═══════════════════════════════════════════════════════════════════════════════╗
+# ║     █████╗ ██╗   ██╗██████╗ ██╗██╗  ██╗                                      ║
+# ║    ██╔══██╗██║   ██║██╔══██╗██║╚██╗██╔╝                                      ║
+# ║    ███████║██║   ██║██████╔╝██║ ╚███╔╝                                       ║
+# ║    ██╔══██║██║   ██║██╔══██╗██║ ██╔██╗                                       ║
+# ║    ██║  ██║╚██████╔╝██║  ██║██║██╔╝ ██╗                                      ║
+# ║    ╚═╝  ╚═╝ ╚═════╝ ╚═╝  ╚═╝╚═╝╚═╝  ╚═╝                                      ║
+# ║                                                                               ║
+# ║    Intelligent Audit. Elevated Assurance.                                    ║
+# ║    Version: 4.0.0 Enterprise                                                 ║
+# ╚═══════════════════════════════════════════════════════════════════════════════╝
 
+"""
 Main entry point for AURIX application.
 This file should remain minimal - all logic is in modules.
 """
 
 import streamlit as st
 from app.config import settings, init_app
-from app.router import Router
+from app.router import get_router
 from utils.logger import setup_logger
 
 # Initialize logger
@@ -39,7 +39,7 @@ def main():
     )
     
     # Initialize router and render
-    router = Router()
+    router = get_router()
     router.render()
     
     logger.info("AURIX application rendered successfully")
@@ -3,45 +3,122 @@ Application Router - Handles page navigation and rendering.
 AURIX Excellence 2026 Edition
 """
 
+import importlib
+import sys
 import streamlit as st
-from typing import Dict, Callable, Any
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Callable, Any, Mapping
 
+from data.models import pin_today
 from ui.components.sidebar import render_sidebar
 from ui.components.floating_copilot import render_floating_copilot
 from ui.styles.css_builder import inject_css
-from ui.pages import (
-    dashboard,
-    documents,
-    ptcf_builder,
-    risk_assessment,
-    findings,
-    continuous_audit,
-    kri_dashboard,
-    fraud_detection,
-    regulatory_compliance,
-    chat,
-    analytics,
-    settings,
-    help,
-    about,
-    error,
-    not_found
-)
-# Enhanced modules v4.1
-from ui.pages import workpaper, audit_planning, sampling, report_builder
-# WOW modules v4.2
-from ui.pages import (
-    gamification,
-    risk_universe,
-    root_cause,
-    issue_tracker,
-    command_center,
-    ai_lab,
-    timeline,
-    team_hub
-)
-# 2026 Excellence modules
-from ui.pages import process_mining, regulatory_rag, executive_dashboard
+
+
+@lru_cache(maxsize=None)
+def _load_page(module_name: str) -> Callable:
+    """Import a page module from ui.pages on first use and return its render()."""
+    return importlib.import_module(f"ui.pages.{module_name}").render
+
+
+def _batch_state(**kv: Any) -> None:
+    """Write several session_state keys, skipping values that are unchanged."""
+    state = st.session_state
+    for key, value in kv.items():
+        if state.get(key) != value:
+            state[key] = value
+
+
+def _interned(table: Dict[str, str]) -> Mapping[str, str]:
+    """Read-only copy of a page table with interned page-name keys."""
+    return MappingProxyType({sys.intern(k): v for k, v in table.items()})
+
+
+# Page name -> ui.pages module name; modules are imported on first visit
+ROUTES: Mapping[str, str] = _interned({
+    # Main
+    "📊 Dashboard": "dashboard",
+    "🏛️ Executive Dashboard": "executive_dashboard",
+    "🎛️ Command Center": "command_center",
+    "📁 Documents": "documents",
+    "🎭 PTCF Builder": "ptcf_builder",
+    # Audit Tools
+    "⚖️ Risk Assessment": "risk_assessment",
+    "🌐 Risk Universe": "risk_universe",
+    "📋 Findings Tracker": "findings",
+    "📌 Issue Tracker": "issue_tracker",
+    "📝 Workpapers": "workpaper",
+    "📅 Audit Planning": "audit_planning",
+    "📆 Audit Timeline": "timeline",
+    "🔬 Root Cause Analyzer": "root_cause",
+    "🧮 Sampling Calculator": "sampling",
+    # Monitoring
+    "🔄 Continuous Audit": "continuous_audit",
+    "📈 KRI Dashboard": "kri_dashboard",
+    "🔍 Fraud Detection": "fraud_detection",
+    # 2026 Intelligence
+    "🔄 Process Mining": "process_mining",
+    "📜 Regulatory RAG": "regulatory_rag",
+    # Intelligence
+    "🤖 AI Chat": "chat",
+    "🧪 AI Lab": "ai_lab",
+    "📊 Analytics": "analytics",
+    "📑 Report Builder": "report_builder",
+    # Collaboration
+    "👥 Team Hub": "team_hub",
+    "🎮 Gamification": "gamification",
+    # Reference
+    "📚 Regulations": "regulatory_compliance",
+    "⚙️ Settings": "settings",
+    "❓ Help": "help",
+    "ℹ️ About": "about",
+})
+
+PAGE_CATEGORIES: Mapping[str, List[str]] = MappingProxyType({
+    "Main": [
+        "📊 Dashboard",
+        "🏛️ Executive Dashboard",
+        "🎛️ Command Center",
+        "📁 Documents",
+        "🎭 PTCF Builder",
+    ],
+    "Audit Tools": [
+        "⚖️ Risk Assessment",
+        "🌐 Risk Universe",
+        "📋 Findings Tracker",
+        "📌 Issue Tracker",
+        "📝 Workpapers",
+        "📅 Audit Planning",
+        "📆 Audit Timeline",
+        "🔬 Root Cause Analyzer",
+        "🧮 Sampling Calculator",
+    ],
+    "Monitoring": [
+        "🔄 Continuous Audit",
+        "📈 KRI Dashboard",
+        "🔍 Fraud Detection",
+        "🔄 Process Mining",
+        "📜 Regulatory RAG",
+    ],
+    "Intelligence": [
+        "🤖 AI Chat",
+        "🧪 AI Lab",
+        "📊 Analytics",
+        "📑 Report Builder",
+    ],
+    "Collaboration": [
+        "👥 Team Hub",
+        "🎮 Gamification",
+    ],
+    "Reference": [
+        "📚 Regulations",
+        "⚙️ Settings",
+        "❓ Help",
+        "ℹ️ About",
+    ]
+})
 
 
 class Router:
@@ -52,102 +129,36 @@ class Router:
     
     def __init__(self):
         """Initialize router with page mappings."""
-        self.routes: Dict[str, Callable] = {
-            # Main
-            "📊 Dashboard": dashboard.render,
-            "🏛️ Executive Dashboard": executive_dashboard.render,
-            "🎛️ Command Center": command_center.render,
-            "📁 Documents": documents.render,
-            "🎭 PTCF Builder": ptcf_builder.render,
-            # Audit Tools
-            "⚖️ Risk Assessment": risk_assessment.render,
-            "🌐 Risk Universe": risk_universe.render,
-            "📋 Findings Tracker": findings.render,
-            "📌 Issue Tracker": issue_tracker.render,
-            "📝 Workpapers": workpaper.render,
-            "📅 Audit Planning": audit_planning.render,
-            "📆 Audit Timeline": timeline.render,
-            "🔬 Root Cause Analyzer": root_cause.render,
-            "🧮 Sampling Calculator": sampling.render,
-            # Monitoring
-            "🔄 Continuous Audit": continuous_audit.render,
-            "📈 KRI Dashboard": kri_dashboard.render,
-            "🔍 Fraud Detection": fraud_detection.render,
-            # 2026 Intelligence
-            "🔄 Process Mining": process_mining.render,
-            "📜 Regulatory RAG": regulatory_rag.render,
-            # Intelligence
-            "🤖 AI Chat": chat.render,
-            "🧪 AI Lab": ai_lab.render,
-            "📊 Analytics": analytics.render,
-            "📑 Report Builder": report_builder.render,
-            # Collaboration
-            "👥 Team Hub": team_hub.render,
-            "🎮 Gamification": gamification.render,
-            # Reference
-            "📚 Regulations": regulatory_compliance.render,
-            "⚙️ Settings": settings.render,
-            "❓ Help": help.render,
-            "ℹ️ About": about.render,
-        }
-        
-        self.page_categories = {
-            "Main": [
-                "📊 Dashboard",
-                "🏛️ Executive Dashboard",
-                "🎛️ Command Center",
-                "📁 Documents",
-                "🎭 PTCF Builder",
-            ],
-            "Audit Tools": [
-                "⚖️ Risk Assessment",
-                "🌐 Risk Universe",
-                "📋 Findings Tracker",
-                "📌 Issue Tracker",
-                "📝 Workpapers",
-                "📅 Audit Planning",
-                "📆 Audit Timeline",
-                "🔬 Root Cause Analyzer",
-                "🧮 Sampling Calculator",
-            ],
-            "Monitoring": [
-                "🔄 Continuous Audit",
-                "📈 KRI Dashboard",
-                "🔍 Fraud Detection",
-                "🔄 Process Mining",
-                "📜 Regulatory RAG",
-            ],
-            "Intelligence": [
-                "🤖 AI Chat",
-                "🧪 AI Lab",
-                "📊 Analytics",
-                "📑 Report Builder",
-            ],
-            "Collaboration": [
-                "👥 Team Hub",
-                "🎮 Gamification",
-            ],
-            "Reference": [
-                "📚 Regulations",
-                "⚙️ Settings",
-                "❓ Help",
-                "ℹ️ About",
-            ]
+        self.routes: Mapping[str, str] = ROUTES
+        self.page_categories: Mapping[str, List[str]] = PAGE_CATEGORIES
+
+        # Precomputed once; reused by every render
+        self._route_keys = tuple(ROUTES)
+        self._category_order = tuple(PAGE_CATEGORIES)
+        self._page_to_category: Dict[str, str] = {
+            page: category
+            for category, pages in PAGE_CATEGORIES.items()
+            for page in pages
         }
+        self._icons: Dict[str, str] = {k: self._split_icon(k) for k in ROUTES}
+        self._titles: Dict[str, str] = {k: self._split_title(k) for k in ROUTES}
     
     def render(self):
         """Main render method - renders sidebar, page, and floating copilot."""
+        # One clock read per render for finding due-date checks
+        pin_today()
+
         # Inject CSS styles
         inject_css()
         
         # Render sidebar and get selected page
         selected_page = render_sidebar(
-            routes=list(self.routes.keys()),
+            routes=self._route_keys,
             categories=self.page_categories
         )
         
         # Store current page in session
-        st.session_state.current_page = selected_page
+        _batch_state(current_page=selected_page)
         
         # Render selected page
         self._render_page(selected_page)
@@ -158,37 +169,56 @@ class Router:
     
     def _render_page(self, page_name: str):
         """Render specific page by name."""
-        if page_name in self.routes:
-            try:
-                self.routes[page_name]()
-            except Exception as e:
-                self._render_error_page(page_name, e)
-        else:
-            self._render_404(page_name)
+        module_name = self.routes.get(page_name)
+        if module_name is None:
+            return self._render_404(page_name)
+        try:
+            _load_page(module_name)()
+        except Exception as e:
+            self._render_error_page(page_name, e)
     
     def _render_error_page(self, page_name: str, err: Exception):
         """Render error page when page fails to load."""
-        st.session_state.error_timestamp = st.session_state.get('error_timestamp', '')
-        from datetime import datetime
-        st.session_state.error_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        error.render(
+        _batch_state(
+            error_timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            error_code="ERR_PAGE_LOAD",
+        )
+
+        _load_page("error")(
             error_message=f"Failed to load {page_name}: {str(err)}",
             error_code="ERR_PAGE_LOAD"
         )
     
     def _render_404(self, requested_page: str = ""):
         """Render 404 not found page."""
-        not_found.render(requested_page)
+        _load_page("not_found")(requested_page)
     
+    def get_category(self, page_name: str) -> str:
+        """Get the navigation category a page belongs to ("" if none)."""
+        return self._page_to_category.get(page_name, "")
+
     def get_page_icon(self, page_name: str) -> str:
         """Extract icon from page name."""
-        if " " in page_name:
-            return page_name.split(" ")[0]
-        return "📄"
+        icon = self._icons.get(page_name)
+        return icon if icon is not None else self._split_icon(page_name)
     
     def get_page_title(self, page_name: str) -> str:
         """Extract title from page name (without icon)."""
-        if " " in page_name:
-            return " ".join(page_name.split(" ")[1:])
-        return page_name
+        title = self._titles.get(page_name)
+        return title if title is not None else self._split_title(page_name)
+
+    @staticmethod
+    def _split_icon(page_name: str) -> str:
+        head, sep, _ = page_name.partition(" ")
+        return head if sep else "📄"
+
+    @staticmethod
+    def _split_title(page_name: str) -> str:
+        _, sep, tail = page_name.partition(" ")
+        return tail if sep else page_name
+
+
+@st.cache_resource
+def get_router() -> Router:
+    """Get the shared Router; built once per server process."""
+    return Router()
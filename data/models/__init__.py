@@ -3,37 +3,71 @@ Data Models for AURIX using Pydantic.
 Provides type safety and validation for all data structures.
 """
 
+from dataclasses import asdict, dataclass, field
+from contextvars import ContextVar
 from datetime import datetime, date
-from typing import Optional, List, Dict, Any
-from enum import Enum
-from pydantic import BaseModel, Field, validator
+from functools import lru_cache
+from typing import Annotated, Optional, List, Dict, Any
+from enum import StrEnum
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+import itertools
+import numpy as np
+import secrets
 import uuid
 
 
+# Entity ids: a random per-process prefix plus a monotonic counter
+_ID_PREFIX = uuid.uuid4().hex[:8]
+_ID_COUNTER = itertools.count()
+
+
+def _new_id() -> str:
+    return f"{_ID_PREFIX}{next(_ID_COUNTER):08x}"
+
+
+# Bounded numeric field types
+UnitInterval = Annotated[float, Field(ge=0.0, le=1.0)]
+Percentage = Annotated[int, Field(ge=0, le=100)]
+
+
+# "Today" pinned for the current render; unset means read the clock
+_PINNED_TODAY: ContextVar[Optional[date]] = ContextVar("aurix_today", default=None)
+
+
+def pin_today(today: Optional[date] = None) -> None:
+    """Pin the date used by date checks for the rest of this render."""
+    _PINNED_TODAY.set(today or date.today())
+
+
+def _today() -> date:
+    today = _PINNED_TODAY.get()
+    return today if today is not None else date.today()
+
+
 # ============================================
 # Enums
 # ============================================
 
-class RiskLevel(str, Enum):
+class RiskLevel(StrEnum):
     HIGH = "HIGH"
     MEDIUM = "MEDIUM"
     LOW = "LOW"
 
 
-class FindingStatus(str, Enum):
+class FindingStatus(StrEnum):
     OPEN = "Open"
     IN_PROGRESS = "In Progress"
     CLOSED = "Closed"
     OVERDUE = "Overdue"
 
 
-class ControlEffectiveness(str, Enum):
+class ControlEffectiveness(StrEnum):
     EFFECTIVE = "Effective"
     PARTIALLY_EFFECTIVE = "Partially Effective"
     NOT_EFFECTIVE = "Not Effective"
 
 
-class DocumentCategory(str, Enum):
+class DocumentCategory(StrEnum):
     AUDIT_REPORTS = "Audit Reports"
     SOP_POLICIES = "SOP/Policies"
     REGULATIONS = "Regulations"
@@ -50,12 +84,21 @@ class DocumentCategory(str, Enum):
 
 class BaseEntity(BaseModel):
     """Base model for all entities with common fields."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False)
+
+    @classmethod
+    def from_trusted(cls, **data: Any):
+        """
+        Build an entity from already-validated data, skipping validation.
+        
+        For bulk loads from storage only; user input goes through __init__.
+        Nested models must already be model instances.
+        """
+        return cls.model_construct(**data)
 
 
 # ============================================
@@ -73,16 +116,18 @@ class Document(BaseEntity):
     chunks: List[str] = Field(default_factory=list)
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
-    @validator('name')
-    def validate_name(cls, v):
-        if not v or len(v.strip()) == 0:
+    @field_validator('name')
+    @classmethod
+    def validate_name(cls, v: str) -> str:
+        stripped = v.strip() if v else ""
+        if not stripped:
             raise ValueError('Document name cannot be empty')
-        return v.strip()
+        return stripped
 
 
 class DocumentChunk(BaseModel):
     """Chunk of processed document for RAG."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4())[:12])
+    id: str = Field(default_factory=lambda: secrets.token_hex(6))
     document_id: str
     content: str
     sequence: int
@@ -90,6 +135,19 @@ class DocumentChunk(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+_CHUNK_LIST_ADAPTER = TypeAdapter(List[DocumentChunk])
+
+
+def dump_chunks_json(chunks: List[DocumentChunk]) -> bytes:
+    """Serialize a list of chunks (embeddings included) to JSON bytes."""
+    return _CHUNK_LIST_ADAPTER.dump_json(chunks)
+
+
+def load_chunks_json(data: bytes) -> List[DocumentChunk]:
+    """Parse JSON produced by dump_chunks_json back into chunks."""
+    return _CHUNK_LIST_ADAPTER.validate_json(data)
+
+
 # ============================================
 # Risk Models
 # ============================================
@@ -97,8 +155,8 @@ class DocumentChunk(BaseModel):
 class RiskFactor(BaseModel):
     """Individual risk factor."""
     name: str
-    score: float = Field(ge=0.0, le=1.0)
-    weight: float = Field(default=1.0, ge=0.0, le=1.0)
+    score: UnitInterval
+    weight: UnitInterval = 1.0
     description: str = ""
 
 
@@ -120,23 +178,27 @@ class RiskAssessment(BaseEntity):
     
     # Metadata
     assessed_by: str = ""
-    assessed_date: date = Field(default_factory=date.today)
+    assessed_date: date = Field(default_factory=_today)
     
+    @property
+    def _inherent_arrays(self) -> "tuple[np.ndarray, np.ndarray]":
+        return _factor_arrays(self.inherent_factors)
+
+    @property
+    def _control_arrays(self) -> "tuple[np.ndarray, np.ndarray]":
+        return _factor_arrays(self.control_factors)
+
     def calculate_scores(self, inherent_weight: float = 0.6):
         """Calculate risk scores based on factors."""
         if self.inherent_factors:
-            total_weight = sum(f.weight for f in self.inherent_factors)
-            if total_weight > 0:
-                self.inherent_risk_score = sum(
-                    f.score * f.weight for f in self.inherent_factors
-                ) / total_weight
+            score = _weighted_mean(*self._inherent_arrays)
+            if score is not None:
+                self.inherent_risk_score = score
         
         if self.control_factors:
-            total_weight = sum(f.weight for f in self.control_factors)
-            if total_weight > 0:
-                self.control_effectiveness_score = sum(
-                    f.score * f.weight for f in self.control_factors
-                ) / total_weight
+            score = _weighted_mean(*self._control_arrays)
+            if score is not None:
+                self.control_effectiveness_score = score
         
         # Residual risk = Inherent * (1 - Control Effectiveness)
         control_weight = 1 - inherent_weight
@@ -144,14 +206,77 @@ class RiskAssessment(BaseEntity):
             self.inherent_risk_score * inherent_weight +
             (1 - self.control_effectiveness_score) * control_weight
         )
-        
-        # Determine risk level
-        if self.residual_risk_score >= 0.7:
-            self.risk_level = RiskLevel.HIGH
-        elif self.residual_risk_score >= 0.4:
-            self.risk_level = RiskLevel.MEDIUM
-        else:
-            self.risk_level = RiskLevel.LOW
+        self.risk_level = _risk_level(self.residual_risk_score)
+
+
+def _factor_arrays(factors: List[RiskFactor]) -> "tuple[np.ndarray, np.ndarray]":
+    """Split factors into parallel (scores, weights) float arrays."""
+    n = len(factors)
+    scores = np.fromiter((f.score for f in factors), dtype=float, count=n)
+    weights = np.fromiter((f.weight for f in factors), dtype=float, count=n)
+    return scores, weights
+
+
+def _weighted_mean(scores: np.ndarray, weights: np.ndarray) -> Optional[float]:
+    """Weighted average of scores, or None when the weights sum to zero."""
+    total_weight = weights.sum()
+    if total_weight <= 0:
+        return None
+    return float(np.dot(scores, weights) / total_weight)
+
+
+def _risk_level(residual_risk_score: float) -> RiskLevel:
+    if residual_risk_score >= 0.7:
+        return RiskLevel.HIGH
+    elif residual_risk_score >= 0.4:
+        return RiskLevel.MEDIUM
+    return RiskLevel.LOW
+
+
+def _stack_factors(factor_lists: List[List[RiskFactor]]) -> "tuple[np.ndarray, np.ndarray]":
+    """Stack factor lists into zero-padded 2D (scores, weights) arrays."""
+    width = max((len(f) for f in factor_lists), default=0)
+    scores = np.zeros((len(factor_lists), width))
+    weights = np.zeros((len(factor_lists), width))
+    for i, factors in enumerate(factor_lists):
+        scores[i, :len(factors)], weights[i, :len(factors)] = _factor_arrays(factors)
+    return scores, weights
+
+
+def calculate_scores_batch(
+    assessments: List[RiskAssessment], inherent_weight: float = 0.6
+) -> np.ndarray:
+    """
+    Recalculate scores for many assessments at once.
+    
+    Equivalent to calling calculate_scores() on each assessment; returns
+    the residual risk scores as an array in input order.
+    """
+    if not assessments:
+        return np.zeros(0)
+
+    current = np.array(
+        [(a.inherent_risk_score, a.control_effectiveness_score) for a in assessments]
+    )
+    results = []
+    for col, attr in enumerate(("inherent_factors", "control_factors")):
+        scores, weights = _stack_factors([getattr(a, attr) for a in assessments])
+        totals = weights.sum(axis=1)
+        weighted = np.einsum("ij,ij->i", scores, weights)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = weighted / totals
+        # Keep the existing score where there are no factors or no weight
+        results.append(np.where(totals > 0, means, current[:, col]))
+
+    inherent, control = results
+    residual = inherent * inherent_weight + (1 - control) * (1 - inherent_weight)
+
+    for a, inh, ctl, res in zip(assessments, inherent, control, residual):
+        a.inherent_risk_score = float(inh)
+        a.control_effectiveness_score = float(ctl)
+        a.residual_risk_score = float(res)
+        a.risk_level = _risk_level(a.residual_risk_score)
+    return residual
 
 
 # ============================================
@@ -166,7 +291,7 @@ class FindingCreate(BaseModel):
     category: str = ""
     description: str = ""
     owner: str = ""
-    due_date: date = Field(default_factory=lambda: date.today())
+    due_date: date = Field(default_factory=_today)
 
 
 class Finding(BaseEntity):
@@ -187,13 +312,13 @@ class Finding(BaseEntity):
     # Tracking
     owner: str = ""
     status: FindingStatus = FindingStatus.OPEN
-    due_date: date = Field(default_factory=date.today)
+    due_date: date = Field(default_factory=_today)
     closed_date: Optional[date] = None
     
     # Management response
     management_response: str = ""
     action_plan: str = ""
-    progress_percentage: int = Field(default=0, ge=0, le=100)
+    progress_percentage: Percentage = 0
     
     # References
     audit_report_id: str = ""
@@ -204,12 +329,12 @@ class Finding(BaseEntity):
         """Check if finding is overdue."""
         if self.status == FindingStatus.CLOSED:
             return False
-        return date.today() > self.due_date
+        return _today() > self.due_date
     
     @property
     def days_remaining(self) -> int:
         """Calculate days remaining until due date."""
-        return (self.due_date - date.today()).days
+        return (self.due_date - _today()).days
 
 
 # ============================================
@@ -218,7 +343,7 @@ class Finding(BaseEntity):
 
 class KRIIndicator(BaseModel):
     """Key Risk Indicator definition."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = Field(default_factory=lambda: secrets.token_hex(4))
     name: str
     category: str
     threshold: float
@@ -228,33 +353,41 @@ class KRIIndicator(BaseModel):
     
     def calculate_status(self, value: float) -> str:
         """Calculate KRI status based on threshold."""
+        return str(self.calculate_status_array(value))
+
+    def calculate_status_array(self, values) -> np.ndarray:
+        """Calculate KRI status for a whole series of values in one pass."""
+        values = np.asarray(values, dtype=float)
         if self.threshold == 0:
-            if value == 0:
-                return "success"
-            elif value <= 2:
-                return "warning"
-            return "danger"
-        
+            idx = np.where(values == 0, 0, np.where(values <= 2, 1, 2))
+            return _KRI_STATUS_LABELS[idx]
+
         if self.good_direction == "lower":
-            if value <= self.threshold * 0.8:
-                return "success"
-            elif value <= self.threshold:
-                return "warning"
-            return "danger"
-        
+            key = values
         elif self.good_direction == "higher":
-            if value >= self.threshold:
-                return "success"
-            elif value >= self.threshold * 0.9:
-                return "warning"
-            return "danger"
-        
+            key = -values
         else:  # optimal
-            if abs(value - self.threshold) <= self.threshold * 0.1:
-                return "success"
-            elif abs(value - self.threshold) <= self.threshold * 0.2:
-                return "warning"
-            return "danger"
+            key = np.abs(values - self.threshold)
+        breaks = _kri_breaks(self.threshold, self.good_direction)
+        return _KRI_STATUS_LABELS[np.searchsorted(breaks, key, side="left")]
+
+
+_KRI_STATUS_LABELS = np.array(["success", "warning", "danger"])
+
+
+@lru_cache(maxsize=256)
+def _kri_breaks(threshold: float, good_direction: str) -> np.ndarray:
+    """Ascending success/warning breakpoints on the calculate_status_array key."""
+    if good_direction == "lower":
+        breaks = (threshold * 0.8, threshold)
+    elif good_direction == "higher":
+        breaks = (-threshold, -threshold * 0.9)
+    else:  # optimal
+        breaks = (threshold * 0.1, threshold * 0.2)
+    # A negative threshold inverts the pair; collapse the warning band instead
+    arr = np.maximum.accumulate(np.array(breaks, dtype=float))
+    arr.flags.writeable = False
+    return arr
 
 
 class KRIValue(BaseModel):
@@ -338,6 +471,18 @@ class PageView(BaseModel):
     session_duration: int = 0
 
 
+@dataclass(slots=True, frozen=True)
+class PageViewRecord:
+    """Slotted page view for in-memory logging; convert at the storage edge."""
+    visitor_id: str
+    page_name: str
+    view_timestamp: datetime = field(default_factory=datetime.now)
+    session_duration: int = 0
+
+    def to_model(self) -> PageView:
+        return PageView.model_construct(**asdict(self))
+
+
 class VisitorStats(BaseModel):
     """Aggregated visitor statistics."""
     total_visits: int = 0
@@ -357,6 +502,8 @@ class VisitorStats(BaseModel):
 
 class LLMResponse(BaseModel):
     """Response from LLM provider."""
+    model_config = ConfigDict(frozen=True)
+
     content: str
     model: str
     tokens_used: int = 0
@@ -367,7 +514,21 @@ class LLMResponse(BaseModel):
 
 class ChatMessage(BaseModel):
     """Chat message model."""
+    model_config = ConfigDict(frozen=True)
+
     role: str  # user, assistant, system
     content: str
     timestamp: datetime = Field(default_factory=datetime.now)
     metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+@dataclass(slots=True, frozen=True)
+class ChatMessageRecord:
+    """Slotted chat message for in-memory history; convert at the API edge."""
+    role: str
+    content: str
+    timestamp: datetime = field(default_factory=datetime.now)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def to_model(self) -> ChatMessage:
+        return ChatMessage.model_construct(**asdict(self))
@@ -3,14 +3,25 @@ Seed Data for AURIX - Static reference data.
 Contains audit universe, regulations, KRI indicators, fraud red flags, etc.
 """
 
-from typing import Dict, List, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Callable, Final, Mapping, Tuple
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
 
 
 # ============================================
 # Regulations Database
 # ============================================
 
-REGULATIONS: Dict[str, List[Dict[str, str]]] = {
+REGULATIONS: Mapping[str, Tuple[Mapping[str, str], ...]] = _freeze({
     "OJK": [
         {"code": "POJK 18/2016", "title": "Penerapan Manajemen Risiko bagi Bank Umum", "category": "Risk Management"},
         {"code": "POJK 55/2016", "title": "Penerapan Tata Kelola bagi Bank Umum", "category": "Governance"},
@@ -32,14 +43,14 @@ REGULATIONS: Dict[str, List[Dict[str, str]]] = {
         {"code": "ISO 31000:2018", "title": "Risk Management Guidelines", "category": "Risk Management"},
         {"code": "ISO 27001:2022", "title": "Information Security Management", "category": "IT Security"},
     ]
-}
+})
 
 
 # ============================================
 # Audit Universe
 # ============================================
 
-AUDIT_UNIVERSE: Dict[str, List[str]] = {
+AUDIT_UNIVERSE: Mapping[str, Tuple[str, ...]] = _freeze({
     "Governance & Compliance": [
         "Board Effectiveness",
         "Committee Governance",
@@ -88,14 +99,14 @@ AUDIT_UNIVERSE: Dict[str, List[str]] = {
         "Customer Due Diligence",
         "Beneficial Ownership"
     ]
-}
+})
 
 
 # ============================================
 # Risk Factors
 # ============================================
 
-RISK_FACTORS: Dict[str, List[str]] = {
+RISK_FACTORS: Mapping[str, Tuple[str, ...]] = _freeze({
     "inherent": [
         "Complexity",
         "Transaction Volume",
@@ -110,14 +121,14 @@ RISK_FACTORS: Dict[str, List[str]] = {
         "Segregation of Duties",
         "Automation Level"
     ]
-}
+})
 
 
 # ============================================
 # KRI Indicators
 # ============================================
 
-KRI_INDICATORS: Dict[str, List[Dict[str, Any]]] = {
+KRI_INDICATORS: Mapping[str, Tuple[Mapping[str, Any], ...]] = _freeze({
     "Credit Risk": [
         {"name": "NPL Ratio", "threshold": 5.0, "unit": "%", "good_direction": "lower"},
         {"name": "CKPN Coverage", "threshold": 100.0, "unit": "%", "good_direction": "higher"},
@@ -150,14 +161,14 @@ KRI_INDICATORS: Dict[str, List[Dict[str, Any]]] = {
         {"name": "Interest Rate Sensitivity", "threshold": 10.0, "unit": "%", "good_direction": "lower"},
         {"name": "FX Exposure", "threshold": 20.0, "unit": "%", "good_direction": "lower"},
     ]
-}
+})
 
 
 # ============================================
 # Fraud Red Flags
 # ============================================
 
-FRAUD_RED_FLAGS: Dict[str, List[str]] = {
+FRAUD_RED_FLAGS: Mapping[str, Tuple[str, ...]] = _freeze({
     "Financial Statement Fraud": [
         "Unusual year-end transactions",
         "Significant related party transactions",
@@ -230,14 +241,14 @@ FRAUD_RED_FLAGS: Dict[str, List[str]] = {
         "No apparent legitimate purpose",
         "PEP involvement without disclosure",
     ]
-}
+})
 
 
 # ============================================
 # Continuous Audit Rules
 # ============================================
 
-CONTINUOUS_AUDIT_RULES: List[Dict[str, Any]] = [
+CONTINUOUS_AUDIT_RULES: Tuple[Mapping[str, Any], ...] = _freeze([
     {"id": 1, "name": "Large Cash Transaction", "description": "Detect cash transactions > $10,000", "category": "AML", "threshold": 10000},
     {"id": 2, "name": "Duplicate Payment", "description": "Identify duplicate vendor payments", "category": "Financial", "threshold": None},
     {"id": 3, "name": "After Hours Access", "description": "System access outside business hours", "category": "IT", "threshold": "18:00-06:00"},
@@ -256,14 +267,14 @@ CONTINUOUS_AUDIT_RULES: List[Dict[str, Any]] = [
     {"id": 16, "name": "High Value Transfer", "description": "Wire transfer > $100,000", "category": "Treasury", "threshold": 100000},
     {"id": 17, "name": "Velocity Check", "description": "Rapid successive transactions", "category": "Fraud", "threshold": "5 in 1 hour"},
     {"id": 18, "name": "Geolocation Anomaly", "description": "Access from unusual location", "category": "Security", "threshold": None},
-]
+])
 
 
 # ============================================
 # System Prompts for LLM
 # ============================================
 
-SYSTEM_PROMPTS: Dict[str, str] = {
+SYSTEM_PROMPTS: Final[Mapping[str, str]] = _freeze({
     "default": """Anda adalah expert Internal Audit profesional yang berspesialisasi dalam institusi keuangan Indonesia.
 Keahlian Anda meliputi:
 - Metodologi risk-based audit (IIA Standards)
@@ -310,14 +321,14 @@ Expertise includes:
 - Fintech regulations (PBI 19/2017)
 
 Focus on access control testing, change management, data integrity controls, business continuity."""
-}
+})
 
 
 # ============================================
 # PTCF Templates
 # ============================================
 
-PTCF_TEMPLATES: Dict[str, Dict[str, str]] = {
+PTCF_TEMPLATES: Final[Mapping[str, Mapping[str, str]]] = _freeze({
     "risk_identification": {
         "persona": "Internal Audit Manager with expertise in risk assessment",
         "task": "Identify and prioritize the top {num_risks} high-risk areas",
@@ -348,43 +359,106 @@ PTCF_TEMPLATES: Dict[str, Dict[str, str]] = {
         "context": "Supporting evidence: {documents}. Follow IIA Standards for reporting.",
         "format": "Structure as: Condition (What was found), Criteria (What should be), Cause (Why it happened), Effect (Impact), and Recommendation"
     }
-}
+})
+
+
+# ============================================
+# Lookup Indexes (built once at import)
+# ============================================
+
+_ALL_AUDIT_AREAS: Tuple[str, ...] = tuple(
+    area for areas in AUDIT_UNIVERSE.values() for area in areas
+)
+
+
+def _group_rules_by_category() -> Mapping[str, Tuple[Mapping[str, Any], ...]]:
+    grouped: Dict[str, List[Mapping[str, Any]]] = {}
+    for rule in CONTINUOUS_AUDIT_RULES:
+        grouped.setdefault(rule["category"], []).append(rule)
+    return MappingProxyType({cat: tuple(rules) for cat, rules in grouped.items()})
+
+
+_CA_RULES_BY_CATEGORY = _group_rules_by_category()
+
+# Bound format_map per PTCF template section
+_PTCF_FORMATTERS: Mapping[str, Mapping[str, Callable[[Mapping[str, Any]], str]]] = MappingProxyType({
+    name: MappingProxyType({section: text.format_map for section, text in sections.items()})
+    for name, sections in PTCF_TEMPLATES.items()
+})
 
 
 # ============================================
 # Helper Functions
 # ============================================
 
-def get_regulations_by_category(category: str) -> List[Dict[str, str]]:
+def get_regulations_by_category(category: str) -> Tuple[Mapping[str, str], ...]:
     """Get regulations by category (OJK, BI, BPKH, ISO)."""
-    return REGULATIONS.get(category, [])
+    return REGULATIONS.get(category, ())
 
 
-def get_audit_areas_by_category(category: str) -> List[str]:
+def get_audit_areas_by_category(category: str) -> Tuple[str, ...]:
     """Get audit areas by category."""
-    return AUDIT_UNIVERSE.get(category, [])
+    return AUDIT_UNIVERSE.get(category, ())
 
 
-def get_all_audit_areas() -> List[str]:
+def get_all_audit_areas() -> Tuple[str, ...]:
     """Get flat list of all audit areas."""
-    return [area for areas in AUDIT_UNIVERSE.values() for area in areas]
+    return _ALL_AUDIT_AREAS
 
 
-def get_kri_by_category(category: str) -> List[Dict[str, Any]]:
+def get_kri_by_category(category: str) -> Tuple[Mapping[str, Any], ...]:
     """Get KRI indicators by category."""
-    return KRI_INDICATORS.get(category, [])
+    return KRI_INDICATORS.get(category, ())
 
 
-def get_fraud_flags_by_category(category: str) -> List[str]:
+def get_fraud_flags_by_category(category: str) -> Tuple[str, ...]:
     """Get fraud red flags by category."""
-    return FRAUD_RED_FLAGS.get(category, [])
+    return FRAUD_RED_FLAGS.get(category, ())
 
 
-def get_ca_rules_by_category(category: str) -> List[Dict[str, Any]]:
+def get_ca_rules_by_category(category: str) -> Tuple[Mapping[str, Any], ...]:
     """Get continuous audit rules by category."""
-    return [r for r in CONTINUOUS_AUDIT_RULES if r["category"] == category]
+    return _CA_RULES_BY_CATEGORY.get(category, ())
+
+
+@lru_cache(maxsize=None)
+def regulations_df():
+    """
+    All regulations as one DataFrame, with the issuing body as a column.
+    
+    Built once and shared; treat the result as read-only.
+    """
+    import pandas as pd
+
+    return pd.DataFrame(
+        [{**reg, "body": body} for body, regs in REGULATIONS.items() for reg in regs]
+    )
+
+
+@lru_cache(maxsize=None)
+def rules_df():
+    """
+    Continuous audit rules as a DataFrame with a categorical category column.
+    
+    Built once and shared; treat the result as read-only.
+    """
+    import pandas as pd
+
+    return pd.DataFrame([dict(rule) for rule in CONTINUOUS_AUDIT_RULES]).astype(
+        {"id": "int32", "category": "category"}
+    )
+
+
+def render_ptcf(name: str, section: str, **values: Any) -> str:
+    """
+    Fill one section of a PTCF template.
+    
+    Example: render_ptcf("compliance_review", "task", regulation="POJK 18/2016")
+    """
+    return _PTCF_FORMATTERS[name][section](values)
 
 
+@lru_cache(maxsize=None)
 def get_system_prompt(persona: str) -> str:
     """Get system prompt by persona."""
     return SYSTEM_PROMPTS.get(persona, SYSTEM_PROMPTS["default"])
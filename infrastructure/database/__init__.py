@@ -3,12 +3,42 @@ Database Infrastructure Layer
 Connection pooling, repositories, and data access patterns
 """
 
-from typing import Optional, Dict, Any, List, TypeVar, Generic
+from typing import (
+    Optional, Dict, Any, Final, Iterable, Iterator, List, Mapping, Sequence, Tuple,
+    TypeVar, Generic,
+)
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
 import logging
+import re
+import threading
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSONB decoding
+    orjson = None
+
+try:
+    from cachetools import TTLCache
+except ImportError:  # optional: repository id cache
+    TTLCache = None
+
+# Drivers are resolved once at import; initialize() only checks the sentinels
+try:
+    from psycopg import ClientCursor
+    from psycopg.types.json import set_json_loads
+    from psycopg_pool import ConnectionPool as PgPool
+except ImportError:  # optional: psycopg3 driver and pool
+    PgPool = None
+
+try:
+    from psycopg2 import pool as pg2_pool
+    from psycopg2.extras import execute_values, register_default_jsonb
+except ImportError:  # optional: psycopg2 fallback driver
+    pg2_pool = None
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +46,7 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseConfig:
     """Database connection configuration"""
     host: str
@@ -28,14 +58,29 @@ class DatabaseConfig:
     max_connections: int = 10
     ssl_mode: str = "require"
     
-    @property
-    def connection_string(self) -> str:
-        """Generate PostgreSQL connection string"""
-        return (
+    # Built once in __post_init__; rebuilt by invalidate_connection_string()
+    _connection_string: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.invalidate_connection_string()
+    
+    def invalidate_connection_string(self) -> None:
+        """Rebuild the cached connection string (e.g. after password rotation)"""
+        self._connection_string = (
             f"postgresql://{self.user}:{self.password}@"
             f"{self.host}:{self.port}/{self.database}"
             f"?sslmode={self.ssl_mode}"
         )
+    
+    @property
+    def connection_string(self) -> str:
+        """PostgreSQL connection string"""
+        return self._connection_string
+
+
+def _is_read_query(query: str) -> bool:
+    """True for plain SELECT statements, which need no commit"""
+    return query.lstrip()[:6].upper() == "SELECT"
 
 
 class ConnectionPool:
@@ -44,37 +89,69 @@ class ConnectionPool:
     Handles connection lifecycle and pooling
     """
     
+    __slots__ = ("config", "_pool", "_initialized", "_driver")
+    
     def __init__(self, config: DatabaseConfig):
         self.config = config
         self._pool = None
         self._initialized = False
+        self._driver: Optional[str] = None
         
     def initialize(self) -> bool:
-        """Initialize the connection pool"""
-        try:
-            import psycopg2
-            from psycopg2 import pool
-            
-            self._pool = pool.ThreadedConnectionPool(
-                self.config.min_connections,
-                self.config.max_connections,
-                host=self.config.host,
-                port=self.config.port,
-                database=self.config.database,
-                user=self.config.user,
-                password=self.config.password,
-                sslmode=self.config.ssl_mode
-            )
-            self._initialized = True
-            logger.info("Database connection pool initialized successfully")
-            return True
-            
-        except ImportError:
-            logger.warning("psycopg2 not available - database features disabled")
+        """Initialize the connection pool (psycopg3 pool, psycopg2 fallback)"""
+        if PgPool is None and pg2_pool is None:
+            logger.warning("psycopg/psycopg2 not available - database features disabled")
             return False
+        try:
+            if PgPool is not None:
+                self._pool = self._create_psycopg_pool()
+                self._driver = "psycopg"
+            else:
+                self._pool = self._create_psycopg2_pool()
+                self._driver = "psycopg2"
         except Exception as e:
             logger.error(f"Failed to initialize database pool: {e}")
             return False
+
+        self._register_json_loads()
+        self._initialized = True
+        logger.info(f"Database connection pool initialized successfully ({self._driver})")
+        return True
+
+    def _register_json_loads(self):
+        """Decode JSONB columns with orjson instead of the stdlib json module"""
+        if orjson is None:
+            return
+        if self._driver == "psycopg":
+            set_json_loads(orjson.loads)
+        else:
+            register_default_jsonb(globally=True, loads=orjson.loads)
+
+    def _create_psycopg_pool(self):
+        """psycopg3 pool: reuses idle connections and closes them after max_idle"""
+        return PgPool(
+            conninfo=self.config.connection_string,
+            min_size=self.config.min_connections,
+            max_size=self.config.max_connections,
+            max_idle=300,
+            timeout=10,
+            num_workers=2,
+            # Server-side prepare statements after 5 executions
+            kwargs={"prepare_threshold": 5},
+            open=True,
+        )
+
+    def _create_psycopg2_pool(self):
+        return pg2_pool.ThreadedConnectionPool(
+            self.config.min_connections,
+            self.config.max_connections,
+            host=self.config.host,
+            port=self.config.port,
+            database=self.config.database,
+            user=self.config.user,
+            password=self.config.password,
+            sslmode=self.config.ssl_mode
+        )
     
     @contextmanager
     def get_connection(self):
@@ -85,6 +162,16 @@ class ConnectionPool:
         if not self._initialized or not self._pool:
             raise RuntimeError("Connection pool not initialized")
         
+        if self._driver == "psycopg":
+            # psycopg3 commits on clean exit, rolls back on error
+            try:
+                with self._pool.connection() as conn:
+                    yield conn
+            except Exception as e:
+                logger.error(f"Database error: {e}")
+                raise
+            return
+
         conn = None
         try:
             conn = self._pool.getconn()
@@ -99,13 +186,19 @@ class ConnectionPool:
                 self._pool.putconn(conn)
     
     @contextmanager
-    def get_cursor(self, commit: bool = True):
+    def get_cursor(self, commit: bool = True, client_side: bool = False):
         """
         Context manager for getting database cursor
         Handles commit/rollback automatically
+        
+        client_side=True binds parameters in the client (psycopg2's only
+        mode), which allows several statements in one execute() call.
         """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
+            if client_side and self._driver == "psycopg":
+                cursor = ClientCursor(conn)
+            else:
+                cursor = conn.cursor()
             try:
                 yield cursor
                 if commit:
@@ -116,24 +209,108 @@ class ConnectionPool:
             finally:
                 cursor.close()
     
-    def execute(self, query: str, params: tuple = None) -> Optional[List[tuple]]:
-        """Execute a query and return results"""
-        with self.get_cursor() as cursor:
+    def execute(self, query: str, params: tuple = None,
+                commit: Optional[bool] = None) -> Optional[List[tuple]]:
+        """Execute a query and return results (commits unless it is a SELECT)"""
+        if commit is None:
+            commit = not _is_read_query(query)
+        with self.get_cursor(commit=commit) as cursor:
             cursor.execute(query, params)
             if cursor.description:
                 return cursor.fetchall()
             return None
     
+    def iter_execute(self, query: str, params: tuple = None,
+                     batch_size: int = 1000) -> Iterator[tuple]:
+        """
+        Stream rows through a server-side cursor, batch_size rows at a time
+        Holds a pooled connection until the iterator is exhausted or closed
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor(name="aurix_stream")
+            try:
+                cursor.itersize = batch_size
+                cursor.execute(query, params)
+                yield from cursor
+            finally:
+                cursor.close()
+    
+    @contextmanager
+    def _autocommit_connection(self):
+        """Pooled connection in autocommit mode, restored before check-in"""
+        with self.get_connection() as conn:
+            conn.autocommit = True
+            try:
+                yield conn
+            finally:
+                conn.autocommit = False
+    
+    def fetch(self, query: str, params: tuple = None) -> List[tuple]:
+        """
+        Run a single read-only statement and return all rows
+        Uses autocommit, so no BEGIN/COMMIT round-trips surround the query
+        """
+        with self._autocommit_connection() as conn:
+            if self._driver == "psycopg":
+                return conn.execute(query, params).fetchall()
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, params)
+                return cursor.fetchall() if cursor.description else []
+            finally:
+                cursor.close()
+    
     def execute_many(self, query: str, params_list: List[tuple]) -> int:
-        """Execute a query with multiple parameter sets"""
+        """Execute a query with multiple parameter sets (small batches; see copy_into)"""
         with self.get_cursor() as cursor:
             cursor.executemany(query, params_list)
             return cursor.rowcount
     
+    def copy_into(self, table: str, columns: Sequence[str],
+                  rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Bulk-insert rows with COPY FROM STDIN (psycopg2: execute_values)
+        Prefer this over execute_many for more than ~100 rows
+        """
+        column_list = ", ".join(columns)
+        with self.get_cursor() as cursor:
+            if self._driver == "psycopg":
+                count = 0
+                with cursor.copy(f"COPY {table} ({column_list}) FROM STDIN") as copy:
+                    for row in rows:
+                        copy.write_row(row)
+                        count += 1
+                return count
+            
+            rows = list(rows)
+            execute_values(
+                cursor,
+                f"INSERT INTO {table} ({column_list}) VALUES %s",
+                rows,
+                page_size=1000
+            )
+            return len(rows)
+    
+    def execute_autocommit(self, statements: Sequence[str]) -> None:
+        """
+        Run statements one by one outside a transaction
+        Needed for commands such as CREATE INDEX CONCURRENTLY
+        """
+        with self._autocommit_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                for statement in statements:
+                    cursor.execute(statement)
+            finally:
+                cursor.close()
+    
     def close(self):
         """Close all connections in the pool"""
         if self._pool:
-            self._pool.closeall()
+            if self._driver == "psycopg":
+                self._pool.close()
+            else:
+                self._pool.closeall()
             self._initialized = False
             logger.info("Database connection pool closed")
     
@@ -147,15 +324,46 @@ class BaseRepository(ABC, Generic[T]):
     """
     Abstract base repository implementing common CRUD operations
     Follows Repository Pattern for data access abstraction
+    
+    ConnectionPool, QueryBuilder and MigrationManager use __slots__;
+    subclasses of those must declare __slots__ for any attribute they add.
     """
     
+    # Columns to select; subclasses should list them instead of relying on *
+    _columns: Tuple[str, ...] = ()
+    
+    # Read-through cache for find_by_id/exists; set cache_ttl = 0 to disable
+    # for tables that change quickly
+    cache_ttl: float = 30
+    cache_maxsize: int = 4096
+    
     def __init__(self, pool: ConnectionPool, table_name: str):
         self.pool = pool
         self.table_name = table_name
+        self._id_cache = (
+            TTLCache(maxsize=self.cache_maxsize, ttl=self.cache_ttl)
+            if TTLCache is not None and self.cache_ttl > 0 else None
+        )
+        self._id_cache_lock = threading.Lock()
+        
+        # Query text is fixed per table; build it once
+        columns = ", ".join(self._columns) or "*"
+        self._q_find_by_id = f"SELECT {columns} FROM {table_name} WHERE id = %s"
+        self._q_find_all = f"SELECT {columns} FROM {table_name} ORDER BY id LIMIT %s OFFSET %s"
+        self._q_iter_all = f"SELECT {columns} FROM {table_name} ORDER BY id"
+        self._q_count = f"SELECT COUNT(*) FROM {table_name}"
+        self._q_exists = f"SELECT 1 FROM {table_name} WHERE id = %s LIMIT 1"
+        self._q_delete = f"DELETE FROM {table_name} WHERE id = %s"
     
     @abstractmethod
     def _row_to_entity(self, row: tuple) -> T:
-        """Convert database row to domain entity"""
+        """
+        Convert database row to domain entity
+        
+        Called once per row on every read. Prefer @dataclass(slots=True,
+        frozen=True) entities whose field order matches _columns, so this
+        can simply be `return Entity(*row)`.
+        """
         pass
     
     @abstractmethod
@@ -165,36 +373,56 @@ class BaseRepository(ABC, Generic[T]):
     
     def find_by_id(self, id: Any) -> Optional[T]:
         """Find entity by primary key"""
-        query = f"SELECT * FROM {self.table_name} WHERE id = %s"
-        results = self.pool.execute(query, (id,))
-        if results:
-            return self._row_to_entity(results[0])
-        return None
+        cache = self._id_cache
+        if cache is not None:
+            with self._id_cache_lock:
+                entity = cache.get(id)
+            if entity is not None:
+                return entity
+        
+        results = self.pool.fetch(self._q_find_by_id, (id,))
+        if not results:
+            return None
+        entity = self._row_to_entity(results[0])
+        if cache is not None:
+            with self._id_cache_lock:
+                cache[id] = entity
+        return entity
     
     def find_all(self, limit: int = 100, offset: int = 0) -> List[T]:
-        """Find all entities with pagination"""
-        query = f"SELECT * FROM {self.table_name} ORDER BY id LIMIT %s OFFSET %s"
-        results = self.pool.execute(query, (limit, offset))
-        return [self._row_to_entity(row) for row in (results or [])]
+        """Find all entities with pagination (bounded pages; see iter_all)"""
+        results = self.pool.fetch(self._q_find_all, (limit, offset))
+        return list(map(self._row_to_entity, results)) if results else []
+    
+    def iter_all(self, batch_size: int = 1000) -> Iterator[T]:
+        """Stream every entity without loading the whole table into memory"""
+        return map(self._row_to_entity, self.pool.iter_execute(self._q_iter_all, batch_size=batch_size))
     
     def count(self) -> int:
         """Count all entities"""
-        query = f"SELECT COUNT(*) FROM {self.table_name}"
-        results = self.pool.execute(query)
+        results = self.pool.fetch(self._q_count)
         return results[0][0] if results else 0
     
     def exists(self, id: Any) -> bool:
         """Check if entity exists"""
-        query = f"SELECT 1 FROM {self.table_name} WHERE id = %s LIMIT 1"
-        results = self.pool.execute(query, (id,))
+        if self._id_cache is not None:
+            return self.find_by_id(id) is not None
+        results = self.pool.fetch(self._q_exists, (id,))
         return bool(results)
     
     def delete(self, id: Any) -> bool:
         """Delete entity by id"""
-        query = f"DELETE FROM {self.table_name} WHERE id = %s"
         with self.pool.get_cursor() as cursor:
-            cursor.execute(query, (id,))
-            return cursor.rowcount > 0
+            cursor.execute(self._q_delete, (id,))
+            deleted = cursor.rowcount > 0
+        self._evict(id)
+        return deleted
+    
+    def _evict(self, id: Any) -> None:
+        """Drop a cached entity; call after writes to that row"""
+        if self._id_cache is not None:
+            with self._id_cache_lock:
+                self._id_cache.pop(id, None)
 
 
 class QueryBuilder:
@@ -203,6 +431,11 @@ class QueryBuilder:
     Provides type-safe query construction
     """
     
+    __slots__ = (
+        "table", "_select", "_where", "_params",
+        "_order_by", "_limit", "_offset", "_joins",
+    )
+    
     def __init__(self, table: str):
         self.table = table
         self._select = "*"
@@ -229,9 +462,9 @@ class QueryBuilder:
         return self.where(f"{column} = %s", value)
     
     def where_in(self, column: str, values: List[Any]) -> 'QueryBuilder':
-        """Add WHERE column IN (...) condition"""
-        placeholders = ", ".join(["%s"] * len(values))
-        return self.where(f"{column} IN ({placeholders})", *values)
+        """Add WHERE column IN (...) condition as = ANY(array)"""
+        # One array parameter keeps the SQL text independent of len(values)
+        return self.where(f"{column} = ANY(%s)", list(values))
     
     def where_like(self, column: str, pattern: str) -> 'QueryBuilder':
         """Add WHERE column LIKE pattern condition"""
@@ -263,10 +496,7 @@ class QueryBuilder:
     
     def build(self) -> tuple:
         """Build the final query and parameters"""
-        query_parts = [f"SELECT {self._select} FROM {self.table}"]
-        
-        if self._joins:
-            query_parts.extend(self._joins)
+        query_parts = [f"SELECT {self._select} FROM {self.table}", *self._joins]
         
         if self._where:
             query_parts.append("WHERE " + " AND ".join(self._where))
@@ -274,13 +504,18 @@ class QueryBuilder:
         if self._order_by:
             query_parts.append(f"ORDER BY {self._order_by}")
         
+        # LIMIT/OFFSET are bound parameters so the SQL text stays the same
+        # across pages and can be reused as a prepared statement
+        paging = []
         if self._limit is not None:
-            query_parts.append(f"LIMIT {self._limit}")
+            query_parts.append("LIMIT %s")
+            paging.append(self._limit)
         
         if self._offset is not None:
-            query_parts.append(f"OFFSET {self._offset}")
+            query_parts.append("OFFSET %s")
+            paging.append(self._offset)
         
-        return " ".join(query_parts), tuple(self._params)
+        return " ".join(query_parts), (*self._params, *paging)
 
 
 class MigrationManager:
@@ -289,8 +524,11 @@ class MigrationManager:
     Handles schema versioning and migrations
     """
     
+    __slots__ = ("pool", "_applied")
+    
     def __init__(self, pool: ConnectionPool):
         self.pool = pool
+        self._applied: Optional[set] = None
         self._ensure_migrations_table()
     
     def _ensure_migrations_table(self):
@@ -308,31 +546,69 @@ class MigrationManager:
         except Exception as e:
             logger.warning(f"Could not create migrations table: {e}")
     
+    def _applied_set(self) -> set:
+        """Applied versions, queried once and then kept in sync locally"""
+        if self._applied is None:
+            query = "SELECT version FROM schema_migrations"
+            results = self.pool.execute(query)
+            self._applied = {row[0] for row in (results or [])}
+        return self._applied
+    
     def get_applied_versions(self) -> List[str]:
         """Get list of applied migration versions"""
-        query = "SELECT version FROM schema_migrations ORDER BY version"
-        results = self.pool.execute(query)
-        return [row[0] for row in (results or [])]
-    
-    def apply_migration(self, version: str, name: str, sql: str):
-        """Apply a migration"""
-        applied = self.get_applied_versions()
-        if version in applied:
+        return sorted(self._applied_set())
+    
+    def apply_migration(self, version: str, name: str, sql: str,
+                        indexes: Sequence[str] = ()):
+        """
+        Apply a migration
+        
+        `indexes` are built after the tables commit, one statement at a time
+        outside any transaction (CREATE INDEX CONCURRENTLY), so building them
+        does not lock out readers of existing tables.  The version is only
+        recorded once every index is built; a failed build is retried by the
+        next run (table SQL must therefore be idempotent: IF NOT EXISTS).
+        """
+        if version in self._applied_set():
             logger.info(f"Migration {version} already applied")
             return
         
-        with self.pool.get_cursor() as cursor:
-            # Execute migration SQL
-            cursor.execute(sql)
-            
-            # Record migration
-            cursor.execute(
-                "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
-                (version, name)
-            )
+        record_sql = "INSERT INTO schema_migrations (version, name) VALUES (%s, %s);"
+        if indexes:
+            with self.pool.get_cursor(client_side=True) as cursor:
+                cursor.execute(sql)
+            self._build_indexes(indexes)
+            with self.pool.get_cursor() as cursor:
+                cursor.execute(record_sql, (version, name))
+        else:
+            # Migration SQL and its bookkeeping row go in one round trip
+            full_sql = sql.rstrip().rstrip(";").replace("%", "%%") + ";\n" + record_sql
+            with self.pool.get_cursor(client_side=True) as cursor:
+                cursor.execute(full_sql, (version, name))
         
+        self._applied.add(version)
         logger.info(f"Applied migration {version}: {name}")
     
+    def _build_indexes(self, indexes: Sequence[str]):
+        """
+        Build indexes one at a time; a failed concurrent build leaves an
+        INVALID index that IF NOT EXISTS would skip, so it is dropped before
+        the error is re-raised
+        """
+        for statement in indexes:
+            try:
+                self.pool.execute_autocommit((statement,))
+            except Exception:
+                match = _INDEX_NAME.search(statement)
+                if match:
+                    try:
+                        self.pool.execute_autocommit(
+                            (f"DROP INDEX CONCURRENTLY IF EXISTS {match.group(1)}",)
+                        )
+                    except Exception as e:
+                        logger.warning(f"Could not drop invalid index {match.group(1)}: {e}")
+                raise
+    
     def rollback_migration(self, version: str, rollback_sql: str):
         """Rollback a migration"""
         with self.pool.get_cursor() as cursor:
@@ -342,15 +618,26 @@ class MigrationManager:
                 (version,)
             )
         
+        if self._applied is not None:
+            self._applied.discard(version)
         logger.info(f"Rolled back migration {version}")
 
 
+# Index name in a CREATE INDEX [CONCURRENTLY] [IF NOT EXISTS] statement
+_INDEX_NAME = re.compile(
+    r"INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+NOT\s+EXISTS\s+)?([\w.\"]+)", re.IGNORECASE
+)
+
+
 # AURIX-specific migrations
-AURIX_MIGRATIONS = [
+# SQL whitespace is collapsed at import (see _minify_sql); a migration whose
+# SQL contains whitespace-sensitive text (-- comments, $$ bodies, literals
+# with repeated spaces) must set "raw": True to be sent as written.
+_MIGRATION_SPECS = (
     {
         "version": "001",
         "name": "create_visitor_tables",
-        "up": """
+        "up_tables": """
             CREATE TABLE IF NOT EXISTS visitor_sessions (
                 id SERIAL PRIMARY KEY,
                 visitor_id VARCHAR(255) NOT NULL,
@@ -377,11 +664,12 @@ AURIX_MIGRATIONS = [
                 total_page_views INTEGER DEFAULT 0,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             );
-            
-            CREATE INDEX IF NOT EXISTS idx_page_views_visitor ON page_views(visitor_id);
-            CREATE INDEX IF NOT EXISTS idx_page_views_timestamp ON page_views(view_timestamp);
-            CREATE INDEX IF NOT EXISTS idx_daily_stats_date ON daily_stats(stat_date);
         """,
+        "up_indexes": (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_page_views_visitor ON page_views(visitor_id)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_page_views_timestamp ON page_views(view_timestamp)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_daily_stats_date ON daily_stats(stat_date)",
+        ),
         "down": """
             DROP TABLE IF EXISTS daily_stats;
             DROP TABLE IF EXISTS page_views;
@@ -391,7 +679,7 @@ AURIX_MIGRATIONS = [
     {
         "version": "002",
         "name": "create_audit_tables",
-        "up": """
+        "up_tables": """
             CREATE TABLE IF NOT EXISTS documents (
                 id SERIAL PRIMARY KEY,
                 name VARCHAR(255) NOT NULL,
@@ -452,11 +740,12 @@ AURIX_MIGRATIONS = [
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             );
-            
-            CREATE INDEX IF NOT EXISTS idx_findings_status ON findings(status);
-            CREATE INDEX IF NOT EXISTS idx_findings_rating ON findings(risk_rating);
-            CREATE INDEX IF NOT EXISTS idx_risk_assessments_level ON risk_assessments(risk_level);
         """,
+        "up_indexes": (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_findings_status ON findings(status)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_findings_rating ON findings(risk_rating)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_risk_assessments_level ON risk_assessments(risk_level)",
+        ),
         "down": """
             DROP TABLE IF EXISTS working_papers;
             DROP TABLE IF EXISTS risk_assessments;
@@ -467,7 +756,7 @@ AURIX_MIGRATIONS = [
     {
         "version": "003",
         "name": "create_continuous_audit_tables",
-        "up": """
+        "up_tables": """
             CREATE TABLE IF NOT EXISTS continuous_audit_rules (
                 id SERIAL PRIMARY KEY,
                 name VARCHAR(255) NOT NULL,
@@ -507,30 +796,61 @@ AURIX_MIGRATIONS = [
                 recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 metadata JSONB DEFAULT '{}'
             );
-            
-            CREATE INDEX IF NOT EXISTS idx_ca_rules_active ON continuous_audit_rules(is_active);
-            CREATE INDEX IF NOT EXISTS idx_alerts_unresolved ON audit_alerts(is_resolved) WHERE NOT is_resolved;
-            CREATE INDEX IF NOT EXISTS idx_kri_category ON kri_values(category);
         """,
+        "up_indexes": (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ca_rules_active ON continuous_audit_rules(is_active)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_alerts_unresolved ON audit_alerts(is_resolved) WHERE NOT is_resolved",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_kri_category ON kri_values(category)",
+        ),
         "down": """
             DROP TABLE IF EXISTS kri_values;
             DROP TABLE IF EXISTS audit_alerts;
             DROP TABLE IF EXISTS continuous_audit_rules;
         """
     }
-]
+)
+
+
+_SQL_WHITESPACE = re.compile(r"\s+")
+
+
+def _minify_sql(sql: str) -> str:
+    """Collapse runs of whitespace so less SQL text goes over the wire"""
+    return _SQL_WHITESPACE.sub(" ", sql).strip()
+
+
+def _with_combined_up(spec: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Add the single-transaction "up" script (tables, then plain indexes)
+    Returns a read-only view so the shared migration table cannot be mutated
+    """
+    indexes = [stmt.replace(" CONCURRENTLY", "") + ";" for stmt in spec["up_indexes"]]
+    migration = {**spec, "up": spec["up_tables"].rstrip() + "\n" + "\n".join(indexes)}
+    if not spec.get("raw"):
+        for key in ("up_tables", "up", "down"):
+            migration[key] = _minify_sql(migration[key])
+    return MappingProxyType(migration)
+
+
+AURIX_MIGRATIONS: Final[Tuple[Mapping[str, Any], ...]] = tuple(
+    _with_combined_up(spec) for spec in _MIGRATION_SPECS
+)
 
 
 def run_migrations(pool: ConnectionPool):
     """Run all pending migrations"""
     manager = MigrationManager(pool)
+    applied = set(manager.get_applied_versions())
     
     for migration in AURIX_MIGRATIONS:
+        if migration["version"] in applied:
+            continue
         try:
             manager.apply_migration(
                 migration["version"],
                 migration["name"],
-                migration["up"]
+                migration["up_tables"],
+                migration["up_indexes"]
             )
         except Exception as e:
             logger.error(f"Migration {migration['version']} failed: {e}")
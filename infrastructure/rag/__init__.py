@@ -5,12 +5,22 @@ Document processing, embedding, and retrieval for audit intelligence
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 import hashlib
+import heapq
 import re
 import logging
 
+import numpy as np
+
+try:
+    import faiss
+except ImportError:  # optional: approximate nearest-neighbour index
+    faiss = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -85,6 +95,28 @@ class DocumentProcessor:
         r'PSAK\s*\d+'
     ]
     
+    # Compiled once at class load instead of on every call
+    # All regulation patterns fused into one alternation: a single scan per text
+    _REGULATION_RE = re.compile(
+        '|'.join(f'(?:{p})' for p in REGULATION_PATTERNS), re.IGNORECASE
+    )
+    _WS_RE = re.compile(r'\s+')
+    _SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+    _WORD_CLEAN = re.compile(r'[^\w]')
+    # Keyword tables for the per-document scans, built once
+    _INDONESIAN_WORDS = tuple(
+        f" {w} " for w in ("yang", "dan", "untuk", "dengan", "dari", "pada", "dalam", "adalah", "ini", "itu")
+    )
+    _CATEGORY_SCAN = tuple((cat, tuple(kws)) for cat, kws in CATEGORY_KEYWORDS.items())
+    _RISK_KEYWORDS = (
+        ("high_risk", ("fraud", "penipuan", "kecurangan", "pelanggaran", "material", "critical")),
+        ("control_weakness", ("kelemahan", "weakness", "gap", "deficiency", "kurang", "tidak memadai")),
+        ("finding", ("temuan", "finding", "observasi", "catatan", "rekomendasi", "issue")),
+    )
+    _DOMAIN_TERMS = frozenset(
+        kw.lower() for keywords in CATEGORY_KEYWORDS.values() for kw in keywords
+    )
+    
     def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
@@ -118,17 +150,22 @@ class DocumentProcessor:
         chunks = []
         sentences = self._split_into_sentences(content)
         
-        current_chunk = ""
+        # Pieces of the chunk being built, joined once on flush; current_len
+        # is the joined length plus one separator per piece
+        current_parts: List[str] = []
+        current_len = 0
         current_sentences = []
         
         for sentence in sentences:
-            if len(current_chunk) + len(sentence) <= self.chunk_size:
-                current_chunk += sentence + " "
+            if current_len + len(sentence) <= self.chunk_size:
+                current_parts.append(sentence)
+                current_len += len(sentence) + 1
                 current_sentences.append(sentence)
             else:
-                if current_chunk.strip():
+                chunk_text = " ".join(current_parts).strip()
+                if chunk_text:
                     chunks.append(self._create_chunk(
-                        current_chunk.strip(), 
+                        chunk_text, 
                         doc_metadata, 
                         filename,
                         len(chunks)
@@ -137,13 +174,15 @@ class DocumentProcessor:
                 # Start new chunk with overlap
                 overlap_count = min(2, len(current_sentences))
                 overlap_text = " ".join(current_sentences[-overlap_count:]) if current_sentences else ""
-                current_chunk = overlap_text + " " + sentence + " "
+                current_parts = [overlap_text, sentence]
+                current_len = len(overlap_text) + len(sentence) + 2
                 current_sentences = [sentence]
         
         # Add final chunk
-        if current_chunk.strip():
+        chunk_text = " ".join(current_parts).strip()
+        if chunk_text:
             chunks.append(self._create_chunk(
-                current_chunk.strip(), 
+                chunk_text, 
                 doc_metadata, 
                 filename,
                 len(chunks)
@@ -176,65 +215,62 @@ class DocumentProcessor:
     
     def _extract_metadata(self, content: str, filename: str) -> Dict[str, Any]:
         """Extract metadata from document content"""
+        # Lowercase once and share it across the keyword scans
+        text_lower = content.lower()
         return {
             "filename": filename,
             "processed_at": datetime.now().isoformat(),
             "word_count": len(content.split()),
             "char_count": len(content),
-            "language": self._detect_language(content),
-            "categories": self._classify_document(content),
+            "language": self._detect_language(content, text_lower),
+            "categories": self._classify_document(content, text_lower),
             "regulations_mentioned": self._extract_regulations(content),
-            "risk_indicators": self._extract_risk_indicators(content)
+            "risk_indicators": self._extract_risk_indicators(content, text_lower)
         }
     
     def _split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences, handling Indonesian patterns"""
-        # Handle bullet points and numbered lists
-        text = re.sub(r'\n+', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
+        # Collapse newlines (bullet points, numbered lists) and other whitespace
+        text = self._WS_RE.sub(' ', text)
         
         # Split on sentence endings
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = self._SENT_SPLIT.split(text)
         return [s.strip() for s in sentences if s.strip()]
     
-    def _detect_language(self, text: str) -> str:
+    def _detect_language(self, text: str, text_lower: Optional[str] = None) -> str:
         """Detect if text is Indonesian or English"""
-        indonesian_words = ["yang", "dan", "untuk", "dengan", "dari", "pada", "dalam", "adalah", "ini", "itu"]
-        text_lower = text.lower()
-        indonesian_count = sum(1 for word in indonesian_words if f" {word} " in f" {text_lower} ")
-        return "id" if indonesian_count >= 3 else "en"
-    
-    def _classify_document(self, text: str) -> List[str]:
+        padded = f" {text.lower() if text_lower is None else text_lower} "
+        indonesian_count = 0
+        for word in self._INDONESIAN_WORDS:
+            if word in padded:
+                indonesian_count += 1
+                if indonesian_count >= 3:
+                    return "id"
+        return "en"
+    
+    def _classify_document(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Classify document into audit categories"""
-        categories = []
-        text_lower = text.lower()
-        
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            if any(kw in text_lower for kw in keywords):
-                categories.append(category)
-        
+        if text_lower is None:
+            text_lower = text.lower()
+        categories = [
+            category for category, keywords in self._CATEGORY_SCAN
+            if any(kw in text_lower for kw in keywords)
+        ]
         return categories if categories else ["general"]
     
     def _extract_regulations(self, text: str) -> List[str]:
         """Extract mentioned regulations"""
-        regulations = []
-        for pattern in self.REGULATION_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            regulations.extend(matches)
-        return list(set(regulations))
+        return list(set(self._REGULATION_RE.findall(text)))
     
-    def _extract_risk_indicators(self, text: str) -> Dict[str, List[str]]:
+    def _extract_risk_indicators(
+        self, text: str, text_lower: Optional[str] = None
+    ) -> Dict[str, List[str]]:
         """Extract risk-related keywords"""
-        risk_keywords = {
-            "high_risk": ["fraud", "penipuan", "kecurangan", "pelanggaran", "material", "critical"],
-            "control_weakness": ["kelemahan", "weakness", "gap", "deficiency", "kurang", "tidak memadai"],
-            "finding": ["temuan", "finding", "observasi", "catatan", "rekomendasi", "issue"]
-        }
-        
         found = {}
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
-        for category, keywords in risk_keywords.items():
+        for category, keywords in self._RISK_KEYWORDS:
             matches = [kw for kw in keywords if kw in text_lower]
             if matches:
                 found[category] = matches
@@ -246,34 +282,33 @@ class DocumentProcessor:
         # Simple keyword extraction based on capitalized words and domain terms
         words = content.split()
         keywords = []
+        clean = self._WORD_CLEAN.sub
+        domain_terms = self._DOMAIN_TERMS
         
         for word in words:
             # Clean word
-            clean_word = re.sub(r'[^\w]', '', word)
+            clean_word = clean('', word)
             if len(clean_word) < 3:
                 continue
             
             # Check if it's likely a keyword (capitalized or domain term)
-            if clean_word[0].isupper() or clean_word.lower() in self._get_domain_terms():
+            if clean_word[0].isupper() or clean_word.lower() in domain_terms:
                 keywords.append(clean_word)
         
         return list(set(keywords))[:20]  # Limit to 20 keywords
     
     def _get_domain_terms(self) -> set:
         """Get set of audit domain terms"""
-        terms = set()
-        for keywords in self.CATEGORY_KEYWORDS.values():
-            terms.update(kw.lower() for kw in keywords)
-        return terms
+        return set(self._DOMAIN_TERMS)
     
     def _generate_doc_id(self, content: str, filename: str) -> str:
         """Generate unique document ID"""
         hash_input = f"{filename}:{content[:1000]}"
-        return hashlib.md5(hash_input.encode()).hexdigest()[:16]
+        return hashlib.blake2b(hash_input.encode(), digest_size=8).hexdigest()
     
     def _generate_chunk_id(self, content: str) -> str:
         """Generate unique chunk ID"""
-        return hashlib.md5(content.encode()).hexdigest()[:12]
+        return hashlib.blake2b(content.encode(), digest_size=6).hexdigest()
 
 
 class VectorStore(ABC):
@@ -306,58 +341,236 @@ class InMemoryVectorStore(VectorStore):
     Suitable for development and small document collections
     """
     
-    def __init__(self):
+    # Below this many vectors an exact matrix product beats an HNSW lookup
+    ANN_MIN_SIZE = 10_000
+    # Rows of the int8 matrix widened to float32 per step of a quantized
+    # search; bounds the temporary to about 6 MB for 384-dim embeddings
+    _SCORE_BLOCK = 4096
+    _TOKEN_RE = re.compile(r'\w+')
+    
+    def __init__(self, quantize: bool = False):
         self.chunks: Dict[str, DocumentChunk] = {}
-        self.embeddings: Dict[str, List[float]] = {}
+        
+        # Keyword index: lowercased content and token -> chunk ids postings,
+        # maintained on add/delete so keyword_search never rescans the corpus
+        self._lowered: Dict[str, str] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._positions: Dict[str, int] = {}  # insertion order, for tie-breaks
+        self._next_position = 0
+        # Stored as contiguous float32 arrays rather than lists of Python floats
+        self.embeddings: Dict[str, np.ndarray] = {}
+        
+        # L2-normalised float32 copy of the embeddings, one row per id in
+        # _ids; brought up to date lazily on the first search after a change.
+        # New ids are appended (_pending); deletes and replacements force a
+        # full rebuild (_dirty).  With quantize=True the copy is kept as int8
+        # rows plus per-row scales (a quarter of the memory, slightly
+        # approximate scores), and the HNSW index stores 8-bit codes too.
+        self.quantize = quantize
+        self._matrix: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        # HNSW graph over the same rows, used for large collections when
+        # faiss is installed; extended on append, rebuilt with _matrix
+        self._index = None
+        self._ids: List[str] = []
+        self._pending: List[str] = []
+        self._dirty = False
     
     def add(self, chunks: List[DocumentChunk], embeddings: List[List[float]] = None):
         """Add chunks with optional embeddings"""
         for i, chunk in enumerate(chunks):
+            self._unindex(chunk.id)
             self.chunks[chunk.id] = chunk
-            if embeddings and i < len(embeddings):
-                self.embeddings[chunk.id] = embeddings[i]
+            self._index_keywords(chunk)
+            if embeddings is not None and i < len(embeddings):
+                if chunk.id in self.embeddings:
+                    self._dirty = True  # replaced row: positions change
+                else:
+                    self._pending.append(chunk.id)
+                self.embeddings[chunk.id] = np.asarray(embeddings[i], dtype=np.float32)
+    
+    def _index_keywords(self, chunk: DocumentChunk):
+        lowered = chunk.content.lower()
+        self._lowered[chunk.id] = lowered
+        if chunk.id not in self._positions:
+            self._positions[chunk.id] = self._next_position
+            self._next_position += 1
+        for token in set(self._TOKEN_RE.findall(lowered)):
+            self._postings.setdefault(token, set()).add(chunk.id)
+    
+    def _unindex(self, chunk_id: str):
+        lowered = self._lowered.pop(chunk_id, None)
+        if lowered is None:
+            return
+        for token in set(self._TOKEN_RE.findall(lowered)):
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.discard(chunk_id)
+                if not posting:
+                    del self._postings[token]
+    
+    def _term_matches(self, term: str) -> Set[str]:
+        """Ids of chunks whose lowercased content contains term"""
+        if self._TOKEN_RE.fullmatch(term):
+            # A run of word characters can only occur inside a single token
+            ids: Set[str] = set()
+            for token, posting in self._postings.items():
+                if term in token:
+                    ids |= posting
+            return ids
+        return {cid for cid, lowered in self._lowered.items() if term in lowered}
+    
+    @staticmethod
+    def _quantize(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Symmetric int8 quantisation with one scale per row (last axis)"""
+        scales = np.abs(values).max(axis=-1, keepdims=True) / 127.0
+        scales = np.where(scales == 0, 1.0, scales).astype(np.float32)
+        quantized = np.clip(np.round(values / scales), -127, 127).astype(np.int8)
+        return quantized, scales
+    
+    def _normalised(self, ids: List[str]) -> np.ndarray:
+        """L2-normalised float32 rows for ids"""
+        matrix = np.asarray([self.embeddings[cid] for cid in ids], dtype=np.float32)
+        if matrix.ndim == 2:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix /= np.where(norms == 0, 1.0, norms)
+        return matrix
+    
+    def _embedding_matrix(self) -> np.ndarray:
+        """Normalised embedding matrix for the stored chunks"""
+        if self._dirty or self._matrix is None:
+            self._ids = [cid for cid in self.embeddings if cid in self.chunks]
+            self._matrix = self._scales = self._index = None
+            self._append_rows(self._normalised(self._ids))
+            self._dirty = False
+        elif self._pending:
+            ids = [cid for cid in self._pending if cid in self.chunks]
+            self._ids.extend(ids)
+            self._append_rows(self._normalised(ids))
+        self._pending.clear()
+        return self._matrix
+    
+    def _append_rows(self, rows: np.ndarray):
+        """Add normalised rows to the search matrix and the ANN index"""
+        if rows.ndim != 2 or not len(rows):
+            if self._matrix is None:
+                self._matrix = rows
+            return
+        values = rows
+        if self.quantize:
+            values, scales = self._quantize(rows)
+            scales = scales.ravel()
+            self._scales = scales if self._scales is None else np.concatenate((self._scales, scales))
+        self._matrix = values if self._matrix is None else np.concatenate((self._matrix, values))
+        self._update_index(rows)
+    
+    def _update_index(self, rows: np.ndarray):
+        """Extend the HNSW index with rows, creating it once the store is large"""
+        if faiss is None or len(self._ids) < self.ANN_MIN_SIZE:
+            return
+        if self._index is None:
+            if len(rows) != len(self._ids):
+                rows = self._normalised(self._ids)
+            dim = rows.shape[1]
+            if self.quantize:
+                # Keep the graph's vectors 8-bit as well, or the index would
+                # hold the full float copy quantize is meant to avoid
+                self._index = faiss.IndexHNSWSQ(
+                    dim, faiss.ScalarQuantizer.QT_8bit, 32, faiss.METRIC_INNER_PRODUCT
+                )
+                self._index.train(np.ascontiguousarray(rows, dtype=np.float32))
+            else:
+                self._index = faiss.IndexHNSWFlat(dim, 32, faiss.METRIC_INNER_PRODUCT)
+        self._index.add(np.ascontiguousarray(rows, dtype=np.float32))
+    
+    def _scores(self, matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Cosine scores of a normalised query against every stored row"""
+        if matrix.dtype != np.int8:
+            return matrix @ query
+        # Widen a block of int8 rows at a time so the matrix-vector product
+        # runs through BLAS without a full-size temporary
+        scores = np.empty(len(matrix), dtype=np.float32)
+        for start in range(0, len(matrix), self._SCORE_BLOCK):
+            stop = start + self._SCORE_BLOCK
+            scores[start:stop] = matrix[start:stop].astype(np.float32) @ query
+        scores *= self._scales
+        return scores
     
     def search(
         self, 
         query_embedding: List[float], 
         top_k: int = 5
     ) -> List[RetrievalResult]:
-        """Search using cosine similarity"""
-        if not self.embeddings:
+        """Search using cosine similarity (one matrix-vector product)"""
+        if not self.embeddings or top_k <= 0:
             return []
         
+        matrix = self._embedding_matrix()
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if matrix.ndim != 2 or query.shape != matrix.shape[1:]:
+            return []
+        query_norm = np.linalg.norm(query)
+        if query_norm:
+            query = query / query_norm
+        
+        if self._index is not None:
+            return self._index_search(query, top_k)
+        
+        scores = self._scores(matrix, query)
+        if top_k < len(scores):
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        
+        results = []
+        for i in top:
+            chunk = self.chunks[self._ids[i]]
+            results.append(RetrievalResult(
+                chunk=chunk,
+                score=float(scores[i]),
+                source_document=chunk.metadata.get("filename", "unknown")
+            ))
+        return results
+    
+    def _index_search(self, query: np.ndarray, top_k: int) -> List[RetrievalResult]:
+        """Approximate top_k search through the faiss HNSW index"""
+        scores, rows = self._index.search(query[None, :], top_k)
         results = []
-        for chunk_id, embedding in self.embeddings.items():
-            score = self._cosine_similarity(query_embedding, embedding)
-            chunk = self.chunks.get(chunk_id)
-            if chunk:
-                results.append(RetrievalResult(
-                    chunk=chunk,
-                    score=score,
-                    source_document=chunk.metadata.get("filename", "unknown")
-                ))
-        
-        results.sort(key=lambda x: x.score, reverse=True)
-        return results[:top_k]
+        for score, i in zip(scores[0], rows[0]):
+            if i < 0:
+                continue
+            chunk = self.chunks[self._ids[i]]
+            results.append(RetrievalResult(
+                chunk=chunk,
+                score=float(score),
+                source_document=chunk.metadata.get("filename", "unknown")
+            ))
+        return results
     
     def keyword_search(self, query: str, top_k: int = 5) -> List[RetrievalResult]:
         """Fallback keyword search"""
         query_terms = query.lower().split()
-        results = []
+        matches: Dict[str, Set[str]] = {}
+        hits: Dict[str, int] = {}
         
-        for chunk_id, chunk in self.chunks.items():
-            content_lower = chunk.content.lower()
-            score = sum(1 for term in query_terms if term in content_lower)
-            
-            if score > 0:
-                results.append(RetrievalResult(
-                    chunk=chunk,
-                    score=score / len(query_terms),
-                    source_document=chunk.metadata.get("filename", "unknown")
-                ))
+        for term in query_terms:
+            if term not in matches:
+                matches[term] = self._term_matches(term)
+            for chunk_id in matches[term]:
+                hits[chunk_id] = hits.get(chunk_id, 0) + 1
         
-        results.sort(key=lambda x: x.score, reverse=True)
-        return results[:top_k]
+        positions = self._positions
+        ranked = sorted(hits, key=lambda cid: (-hits[cid], positions[cid]))
+        results = []
+        for chunk_id in ranked[:top_k]:
+            chunk = self.chunks[chunk_id]
+            results.append(RetrievalResult(
+                chunk=chunk,
+                score=hits[chunk_id] / len(query_terms),
+                source_document=chunk.metadata.get("filename", "unknown")
+            ))
+        return results
     
     def hybrid_search(
         self, 
@@ -370,62 +583,44 @@ class InMemoryVectorStore(VectorStore):
         keyword_results = self.keyword_search(query_text, top_k * 2)
         semantic_results = self.search(query_embedding, top_k * 2) if self.embeddings else []
         
-        # Combine scores
-        combined_scores: Dict[str, Dict] = {}
+        # Blend scores per chunk id; results are only built for the winners
+        combined_scores: Dict[str, float] = {}
+        sources: Dict[str, RetrievalResult] = {}
         
-        for result in keyword_results:
-            combined_scores[result.chunk.id] = {
-                "chunk": result.chunk,
-                "score": (1 - alpha) * result.score,
-                "source": result.source_document
-            }
+        for weight, results in ((1 - alpha, keyword_results), (alpha, semantic_results)):
+            for result in results:
+                chunk_id = result.chunk.id
+                combined_scores[chunk_id] = combined_scores.get(chunk_id, 0.0) + weight * result.score
+                sources.setdefault(chunk_id, result)
         
-        for result in semantic_results:
-            if result.chunk.id in combined_scores:
-                combined_scores[result.chunk.id]["score"] += alpha * result.score
-            else:
-                combined_scores[result.chunk.id] = {
-                    "chunk": result.chunk,
-                    "score": alpha * result.score,
-                    "source": result.source_document
-                }
-        
-        results = [
+        top = heapq.nlargest(top_k, combined_scores.items(), key=itemgetter(1))
+        return [
             RetrievalResult(
-                chunk=data["chunk"],
-                score=data["score"],
-                source_document=data["source"]
+                chunk=sources[chunk_id].chunk,
+                score=score,
+                source_document=sources[chunk_id].source_document
             )
-            for data in combined_scores.values()
+            for chunk_id, score in top
         ]
-        
-        results.sort(key=lambda x: x.score, reverse=True)
-        return results[:top_k]
     
     def delete(self, chunk_ids: List[str]):
         """Delete chunks by ID"""
         for chunk_id in chunk_ids:
+            self._unindex(chunk_id)
+            self._positions.pop(chunk_id, None)
             self.chunks.pop(chunk_id, None)
             self.embeddings.pop(chunk_id, None)
+        self._dirty = True
     
     def clear(self):
         """Clear all data"""
         self.chunks.clear()
+        self._lowered.clear()
+        self._postings.clear()
+        self._positions.clear()
         self.embeddings.clear()
-    
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """Calculate cosine similarity"""
-        if len(vec1) != len(vec2):
-            return 0.0
-        
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = sum(a * a for a in vec1) ** 0.5
-        norm2 = sum(b * b for b in vec2) ** 0.5
-        
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        
-        return dot_product / (norm1 * norm2)
+        self._pending.clear()
+        self._dirty = True
     
     @property
     def size(self) -> int:
@@ -450,9 +645,12 @@ class EmbeddingProvider(ABC):
 class SentenceTransformerEmbedding(EmbeddingProvider):
     """Embedding provider using sentence-transformers"""
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", batch_size: int = 64):
         self.model_name = model_name
+        self.batch_size = batch_size
         self._model = None
+        # Per-instance so the cache dies with the provider
+        self._cached_query = lru_cache(maxsize=1024)(self._encode_query)
     
     def _get_model(self):
         if self._model is None:
@@ -464,17 +662,31 @@ class SentenceTransformerEmbedding(EmbeddingProvider):
                 return None
         return self._model
     
-    def embed(self, texts: List[str]) -> List[List[float]]:
-        model = self._get_model()
-        if model is None:
+    def _encode(self, texts):
+        return self._model.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+    
+    def _encode_query(self, query: str) -> np.ndarray:
+        vector = self._encode(query)
+        vector.setflags(write=False)  # shared by every cache hit
+        return vector
+    
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Unit-length embeddings, one float32 row per text"""
+        if self._get_model() is None:
             return []
-        return model.encode(texts).tolist()
+        return self._encode(texts)
     
-    def embed_query(self, query: str) -> List[float]:
-        model = self._get_model()
-        if model is None:
+    def embed_query(self, query: str) -> np.ndarray:
+        """Unit-length query embedding; repeated queries are served from cache"""
+        if self._get_model() is None:
             return []
-        return model.encode(query).tolist()
+        return self._cached_query(query)
 
 
 class RAGEngine:
@@ -715,6 +715,13 @@ Please provide:
                 temperature=0.3
             )
 
+            # Unreachable providers return an error response instead of raising
+            if response.finish_reason == "error" or not response.content:
+                logger.error(
+                    f"LLM narrative generation failed: {response.metadata.get('error', 'empty response')}"
+                )
+                return self._generate_template_narrative(alert)
+
             # Parse LLM response into structured narrative
             content = response.content
 
@@ -122,6 +122,18 @@ def run_single_benchmark(
         end_time = time.perf_counter()
         latency_ms = (end_time - start_time) * 1000
 
+        # Connection failures come back as error responses, not exceptions
+        if response.finish_reason == "error":
+            return LatencyResult(
+                provider=client.provider_name,
+                model=client.config.get_model(),
+                iteration=iteration,
+                latency_ms=0,
+                tokens_used=0,
+                success=False,
+                error=response.metadata.get("error", "provider error")
+            )
+
         return LatencyResult(
             provider=client.provider_name,
             model=client.config.get_model(),
@@ -33,7 +33,7 @@ if str(ROOT_DIR) not in sys.path:
 
 # Import after path setup
 from app.config import settings, init_app
-from app.router import Router
+from app.router import get_router
 from utils.logger import setup_logger
 
 # Initialize logger
@@ -73,7 +73,7 @@ def main():
         init_app()
         
         # Create and render router
-        router = Router()
+        router = get_router()
         router.render()
         
         logger.debug("AURIX rendered successfully")
@@ -227,8 +227,14 @@ I can help you with:
 What specific area would you like to explore?"""
 
 
+@st.fragment
 def render_floating_copilot():
-    """Render the floating copilot chat interface."""
+    """
+    Render the floating copilot chat interface.
+    
+    Runs as a fragment, so copilot interactions rerun only this panel
+    instead of the router, sidebar and current page.
+    """
     init_copilot_state()
     
     t = get_current_theme()
@@ -242,7 +248,7 @@ def render_floating_copilot():
         
         if st.button(fab_label, key="copilot_fab", help=fab_help):
             st.session_state.copilot_open = not is_open
-            st.rerun()
+            st.rerun(scope="fragment")
     
     # Chat Panel (when open)
     if is_open:
@@ -324,7 +330,7 @@ def render_floating_copilot():
                         "content": response,
                         "timestamp": datetime.now().isoformat()
                     })
-                    st.rerun()
+                    st.rerun(scope="fragment")
         
         # Text input
         user_input = st.text_input(
@@ -350,12 +356,12 @@ def render_floating_copilot():
                     "content": response,
                     "timestamp": datetime.now().isoformat()
                 })
-                st.rerun()
+                st.rerun(scope="fragment")
         
         # Clear chat button
         if st.button("🗑️ Clear Chat", key="clear_copilot"):
             st.session_state.copilot_messages = []
-            st.rerun()
+            st.rerun(scope="fragment")
 
 
 # Export
@@ -172,10 +172,10 @@ def render_llm_config():
         providers,
         key="llm_provider",
         label_visibility="collapsed",
-        format_func=lambda x: f"{LLM_PROVIDER_INFO[x]['name']} {'🆓' if LLM_PROVIDER_INFO[x]['free'] else '💎'}"
+        format_func=lambda x: f"{LLM_PROVIDER_INFO[x].name} {'🆓' if LLM_PROVIDER_INFO[x].free else '💎'}"
     )
 
-    info = LLM_PROVIDER_INFO.get(provider, {})
+    info = LLM_PROVIDER_INFO.get(provider)
 
     if provider not in ['mock', 'ollama']:
         st.text_input(
@@ -186,8 +186,8 @@ def render_llm_config():
             placeholder="Enter API key..."
         )
 
-    if info.get('url'):
-        st.link_button("Get API Key →", info['url'], use_container_width=True)
+    if info and info.url:
+        st.link_button("Get API Key →", info.url, use_container_width=True)
 
 
 def render_sidebar(routes: List[str], categories: Dict[str, List[str]]) -> str:
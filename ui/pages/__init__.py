@@ -1,40 +1,10 @@
 """
 AURIX UI Pages Module.
 All page modules for the application.
+Page modules are imported lazily on first attribute access.
 """
 
-from ui.pages import (
-    dashboard,
-    documents,
-    ptcf_builder,
-    risk_assessment,
-    findings,
-    continuous_audit,
-    kri_dashboard,
-    fraud_detection,
-    regulatory_compliance,
-    chat,
-    analytics,
-    settings,
-    help,
-    about,
-    error,
-    not_found,
-    # Enhanced modules v4.1
-    workpaper,
-    audit_planning,
-    sampling,
-    report_builder,
-    # WOW modules v4.2
-    gamification,
-    risk_universe,
-    root_cause,
-    issue_tracker,
-    command_center,
-    ai_lab,
-    timeline,
-    team_hub
-)
+import importlib
 
 __all__ = [
     'dashboard',
@@ -68,3 +38,10 @@ __all__ = [
     'timeline',
     'team_hub'
 ]
+
+
+def __getattr__(name: str):
+    """Import page modules on first access instead of at package import."""
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -58,7 +58,7 @@ class ChatPage:
         st.markdown(f'''
         <div style="padding:0.5rem;background:{t['bg_secondary']};border-radius:8px;margin-bottom:1rem;">
             <div style="font-size:0.8rem;color:{t['text_muted']} !important;">Current Provider</div>
-            <div style="font-weight:600;color:{t['text']} !important;">{LLM_PROVIDER_INFO.get(provider, {}).get('name', 'Mock')}</div>
+            <div style="font-weight:600;color:{t['text']} !important;">{getattr(LLM_PROVIDER_INFO.get(provider), 'name', 'Mock')}</div>
         </div>
         ''', unsafe_allow_html=True)
         
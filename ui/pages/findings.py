@@ -134,7 +134,7 @@ class FindingsPage:
         with col3:
             area_filter = st.selectbox(
                 "Audit Area",
-                ["All"] + get_all_audit_areas(),
+                ["All", *get_all_audit_areas()],
                 key="findings_area_filter"
             )
         
@@ -95,17 +95,17 @@ class SettingsPage:
                 st.markdown(f'''
                 <div class="pro-card" style="padding:1rem;border:2px solid {border_color};background:{bg_color};cursor:pointer;">
                     <div style="font-weight:600;color:{t['text']} !important;margin-bottom:0.25rem;">
-                        {info['name']} {'✓' if is_selected else ''}
+                        {info.name} {'✓' if is_selected else ''}
                     </div>
                     <div style="font-size:0.8rem;color:{t['text_secondary']} !important;">
-                        {info['description']}
+                        {info.description}
                     </div>
                 </div>
                 ''', unsafe_allow_html=True)
                 
-                if st.button(f"Select {info['name']}", key=f"select_{key}", use_container_width=True):
+                if st.button(f"Select {info.name}", key=f"select_{key}", use_container_width=True):
                     st.session_state.llm_provider = key
-                    st.success(f"✓ Provider changed to {info['name']}")
+                    st.success(f"✓ Provider changed to {info.name}")
                     st.rerun()
         
         st.markdown("---")
@@ -113,14 +113,14 @@ class SettingsPage:
         # API Key configuration
         st.markdown("#### API Key Configuration")
         
-        selected_info = LLM_PROVIDER_INFO.get(current_provider, {})
+        selected_info = LLM_PROVIDER_INFO.get(current_provider, LLM_PROVIDER_INFO['mock'])
         
         if current_provider != 'mock':
             col1, col2 = st.columns([3, 1])
             
             with col1:
                 api_key = st.text_input(
-                    f"{selected_info.get('name', '')} API Key",
+                    f"{selected_info.name} API Key",
                     type="password",
                     value=st.session_state.get('api_key_input', ''),
                     placeholder="Enter your API key...",
@@ -134,11 +134,11 @@ class SettingsPage:
                     st.success("✓ API key saved")
             
             # Get API key link
-            if selected_info.get('url'):
+            if selected_info.url:
                 st.markdown(f'''
                 <div style="margin-top:0.5rem;">
-                    <a href="{selected_info['url']}" target="_blank" style="color:{t['primary']} !important;font-size:0.85rem;">
-                        🔗 Get your {selected_info['name']} API key
+                    <a href="{selected_info.url}" target="_blank" style="color:{t['primary']} !important;font-size:0.85rem;">
+                        🔗 Get your {selected_info.name} API key
                     </a>
                 </div>
                 ''', unsafe_allow_html=True)
@@ -150,7 +150,7 @@ class SettingsPage:
         # Model selection
         st.markdown("#### Model Selection")
         
-        default_model = selected_info.get('default_model', 'N/A')
+        default_model = selected_info.default_model
         
         if current_provider == 'groq':
             models = ['llama-3.3-70b-versatile', 'llama-3.1-70b-versatile', 'mixtral-8x7b-32768', 'gemma2-9b-it']
@@ -186,7 +186,7 @@ class SettingsPage:
                     # Simulate test
                     import time
                     time.sleep(1)
-                    st.success(f"✓ Successfully connected to {selected_info.get('name', 'provider')}!")
+                    st.success(f"✓ Successfully connected to {selected_info.name}!")
     
     def _render_appearance_settings(self):
         """Render appearance settings."""
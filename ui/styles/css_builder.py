@@ -5,6 +5,7 @@ Royal Purple & Gold Premium Theme.
 """
 
 import streamlit as st
+from functools import lru_cache
 from typing import Dict
 from app.constants import COLORS
 
@@ -17,8 +18,19 @@ def get_current_theme() -> Dict[str, str]:
 
 def inject_css():
     """Inject complete CSS styles into the page."""
-    t = get_current_theme()
-    is_dark = st.session_state.get('theme', 'dark') == 'dark'
+    st.markdown(build_css(st.session_state.get('theme', 'dark')), unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=None)
+def build_css(theme_name: str) -> str:
+    """
+    Build the stylesheet for a theme.
+    
+    Cached per theme: the markup still has to be emitted on every rerun,
+    but the f-string is only rendered once.
+    """
+    t = COLORS.get(theme_name, COLORS['dark'])
+    is_dark = theme_name == 'dark'
 
     # Get gold color with fallback
     gold = t.get('gold', t['accent'])
@@ -683,8 +695,7 @@ hr {{
 }}
 </style>
 """
-    
-    st.markdown(css, unsafe_allow_html=True)
+    return css
 
 
 def get_color(color_name: str) -> str: